@@ -1,13 +1,46 @@
 from django.contrib import admin
+from django.core.cache import cache
 from django.utils.html import format_html
 from django.urls import reverse
+from django.utils import timezone
+from django.utils.functional import cached_property
 from django.utils.safestring import mark_safe
-from .models import MemoryCategory, MemoryPhoto, MeetingCategory, MeetingPhoto, MeetingVideo, Colleague, ColleagueArchiveImage
+from django.db import transaction
+from django.db.models import Count, Q
+from .models import (
+    MemoryCategory, MemoryPhoto, MeetingCategory, MeetingPhoto, MeetingVideo, Colleague, ColleagueArchiveImage,
+    delete_files_if_exist, COLLEAGUES_VERSION_CACHE_KEY, DASHBOARD_STATS_CACHE_KEY
+)
+
+# Pre-built changelist link for photos_link; only integers are interpolated, so no escaping is needed
+PHOTOS_COUNT_LINK = '<a href="{}?category__id__exact={}"><strong>{} صور</strong></a>'
+
+
+def raw_delete_with_files(queryset, file_fields):
+    """
+    Delete all rows of a queryset in a single SQL DELETE, bypassing per-instance signals.
+    Ids and file paths are collected in one query beforehand; the same SELECT serves the
+    returned count and scopes the DELETE, and files are removed concurrently after commit.
+    Cached dashboard stats and the colleague list version are dropped here since their
+    post_delete invalidation doesn't run.
+    Returns the number of deleted rows.
+    """
+    rows = list(queryset.values_list('pk', *file_fields))
+    ids = [row[0] for row in rows]
+    file_names = [name for row in rows for name in row[1:] if name]
+    with transaction.atomic():
+        scoped = queryset.model._base_manager.filter(pk__in=ids)
+        scoped._raw_delete(scoped.db)
+        transaction.on_commit(lambda: delete_files_if_exist(file_names))
+        transaction.on_commit(lambda: cache.delete_many([DASHBOARD_STATS_CACHE_KEY, COLLEAGUES_VERSION_CACHE_KEY]))
+    return len(ids)
 
 @admin.register(MemoryCategory)
 class MemoryCategoryAdmin(admin.ModelAdmin):
-    list_display = ['name', 'photos_count', 'created_at']
+    list_display = ['name', 'photos_link', 'created_at']
     list_filter = ['created_at']
+    # Skip the extra unfiltered COUNT(*) the changelist runs on every filtered/searched page
+    show_full_result_count = False
     search_fields = ['name', 'description']
     ordering = ['name']
     fieldsets = [
@@ -19,43 +52,58 @@ class MemoryCategoryAdmin(admin.ModelAdmin):
         })
     ]
     
-    def photos_count(self, obj):
-        count = obj.photos.count()
+    @cached_property
+    def photos_changelist_url(self):
+        """Resolve the photo changelist URL once instead of once per row"""
+        return reverse('admin:api_memoryphoto_changelist')
+    
+    def photos_link(self, obj):
+        count = obj.photos_count
         if count > 0:
-            url = reverse('admin:api_memoryphoto_changelist') + f'?category__id__exact={obj.id}'
-            return format_html('<a href="{}"><strong>{} صور</strong></a>', url, count)
+            return mark_safe(PHOTOS_COUNT_LINK.format(self.photos_changelist_url, int(obj.id), int(count)))
         return '0 صور'
-    photos_count.short_description = 'عدد الصور'
+    photos_link.short_description = 'عدد الصور'
+    photos_link.admin_order_field = 'photos_count'
     
     def delete_model(self, request, obj):
         """Override delete to show warning about file deletion"""
-        photos_count = obj.photos.count()
+        with transaction.atomic():
+            # One SELECT captures ids and file paths; the cascade and signals then find no photos left
+            photos_count = raw_delete_with_files(obj.photos.all(), ['image', 'thumbnail'])
+            super().delete_model(request, obj)
         if photos_count > 0:
-            # The signal will handle the actual file deletion
             self.message_user(
                 request, 
                 f'تم حذف فئة الصور التذكارية "{obj.name}" مع {photos_count} صورة وملفاتها من المجلد.',
                 level='WARNING'
             )
-        super().delete_model(request, obj)
     
     def delete_queryset(self, request, queryset):
         """Override bulk delete to show warning about file deletion"""
-        total_photos = sum(obj.photos.count() for obj in queryset)
         categories_count = queryset.count()
+        with transaction.atomic():
+            # Drop all photos in one DELETE and unlink their files in a thread pool,
+            # instead of a post_delete signal per photo during the cascade
+            total_photos = raw_delete_with_files(
+                MemoryPhoto.objects.filter(category__in=queryset), ['image', 'thumbnail']
+            )
+            super().delete_queryset(request, queryset)
         if total_photos > 0:
             self.message_user(
                 request, 
                 f'تم حذف {categories_count} فئة صور تذكارية مع {total_photos} صورة وملفاتها من المجلد.',
                 level='WARNING'
             )
-        super().delete_queryset(request, queryset)
 
 @admin.register(MemoryPhoto)
 class MemoryPhotoAdmin(admin.ModelAdmin):
     list_display = ['id', 'category', 'is_featured', 'created_at']
     list_filter = ['category', 'is_featured', 'created_at']
+    list_select_related = ['category']
     search_fields = ['description_ar']
+    # Skip the extra unfiltered COUNT(*) and cap rows fetched per changelist page
+    show_full_result_count = False
+    list_per_page = 50
     list_editable = ['is_featured']
     ordering = ['-created_at']
     readonly_fields = ['uploaded_by']
@@ -81,19 +129,24 @@ class MemoryPhotoAdmin(admin.ModelAdmin):
         super().delete_model(request, obj)
     
     def delete_queryset(self, request, queryset):
-        """Override bulk delete to show warning about file deletion"""
-        photos_count = queryset.count()
+        """Override bulk delete to remove rows in one query and files in a thread pool"""
+        # The raw DELETE skips the counter signals, so recount the touched categories afterwards
+        category_ids = list(queryset.order_by().values_list('category_id', flat=True).distinct())
+        with transaction.atomic():
+            photos_count = raw_delete_with_files(queryset, ['image', 'thumbnail'])
+            MemoryCategory.objects.filter(pk__in=category_ids).refresh_photos_count()
         self.message_user(
             request, 
             f'تم حذف {photos_count} صورة تذكارية وملفاتها من المجلد.',
             level='INFO'
         )
-        super().delete_queryset(request, queryset)
 
 @admin.register(MeetingCategory)
 class MeetingCategoryAdmin(admin.ModelAdmin):
-    list_display = ['name', 'photos_count', 'youtube_link_display', 'created_at']
+    list_display = ['name', 'photos_link', 'youtube_link_display', 'created_at']
     list_filter = ['created_at']
+    # Skip the extra unfiltered COUNT(*) the changelist runs on every filtered/searched page
+    show_full_result_count = False
     search_fields = ['name', 'description']
     ordering = ['name']
     fieldsets = [
@@ -114,43 +167,58 @@ class MeetingCategoryAdmin(admin.ModelAdmin):
         return '-'
     youtube_link_display.short_description = 'فيديو يوتيوب'
     
-    def photos_count(self, obj):
-        count = obj.photos.count()
+    @cached_property
+    def photos_changelist_url(self):
+        """Resolve the photo changelist URL once instead of once per row"""
+        return reverse('admin:api_meetingphoto_changelist')
+    
+    def photos_link(self, obj):
+        count = obj.photos_count
         if count > 0:
-            url = reverse('admin:api_meetingphoto_changelist') + f'?category__id__exact={obj.id}'
-            return format_html('<a href="{}"><strong>{} صور</strong></a>', url, count)
+            return mark_safe(PHOTOS_COUNT_LINK.format(self.photos_changelist_url, int(obj.id), int(count)))
         return '0 صور'
-    photos_count.short_description = 'عدد الصور'
+    photos_link.short_description = 'عدد الصور'
+    photos_link.admin_order_field = 'photos_count'
     
     def delete_model(self, request, obj):
         """Override delete to show warning about file deletion"""
-        photos_count = obj.photos.count()
+        with transaction.atomic():
+            # One SELECT captures ids and file paths; the cascade and signals then find no photos left
+            photos_count = raw_delete_with_files(obj.photos.all(), ['image', 'thumbnail'])
+            super().delete_model(request, obj)
         if photos_count > 0:
-            # The signal will handle the actual file deletion
             self.message_user(
                 request, 
                 f'تم حذف فئة اللقاءات "{obj.name}" مع {photos_count} صورة وملفاتها من المجلد.',
                 level='WARNING'
             )
-        super().delete_model(request, obj)
     
     def delete_queryset(self, request, queryset):
         """Override bulk delete to show warning about file deletion"""
-        total_photos = sum(obj.photos.count() for obj in queryset)
         categories_count = queryset.count()
+        with transaction.atomic():
+            # Drop all photos in one DELETE and unlink their files in a thread pool,
+            # instead of a post_delete signal per photo during the cascade
+            total_photos = raw_delete_with_files(
+                MeetingPhoto.objects.filter(category__in=queryset), ['image', 'thumbnail']
+            )
+            super().delete_queryset(request, queryset)
         if total_photos > 0:
             self.message_user(
                 request, 
                 f'تم حذف {categories_count} فئة اللقاءات مع {total_photos} صورة وملفاتها من المجلد.',
                 level='WARNING'
             )
-        super().delete_queryset(request, queryset)
 
 @admin.register(MeetingPhoto)
 class MeetingPhotoAdmin(admin.ModelAdmin):
     list_display = ['id', 'category', 'is_featured', 'created_at']
     list_filter = ['category', 'is_featured', 'created_at']
+    list_select_related = ['category']
     search_fields = ['description_ar']
+    # Skip the extra unfiltered COUNT(*) and cap rows fetched per changelist page
+    show_full_result_count = False
+    list_per_page = 50
     list_editable = ['is_featured']
     ordering = ['-created_at']
     readonly_fields = ['uploaded_by']
@@ -176,20 +244,24 @@ class MeetingPhotoAdmin(admin.ModelAdmin):
         super().delete_model(request, obj)
     
     def delete_queryset(self, request, queryset):
-        """Override bulk delete to show warning about file deletion"""
-        photos_count = queryset.count()
+        """Override bulk delete to remove rows in one query and files in a thread pool"""
+        # The raw DELETE skips the counter signals, so recount the touched categories afterwards
+        category_ids = list(queryset.order_by().values_list('category_id', flat=True).distinct())
+        with transaction.atomic():
+            photos_count = raw_delete_with_files(queryset, ['image', 'thumbnail'])
+            MeetingCategory.objects.filter(pk__in=category_ids).refresh_photos_count()
         self.message_user(
             request, 
             f'تم حذف {photos_count} صورة لقاء وملفاتها من المجلد.',
             level='INFO'
         )
-        super().delete_queryset(request, queryset)
 
 
 @admin.register(MeetingVideo)
 class MeetingVideoAdmin(admin.ModelAdmin):
     list_display = ['id', 'category', 'youtube_url_display', 'is_featured', 'sort_order', 'created_at']
     list_filter = ['category', 'is_featured', 'created_at']
+    list_select_related = ['category']
     search_fields = ['description_ar', 'youtube_url']
     list_editable = ['is_featured', 'sort_order']
     ordering = ['category', 'sort_order', '-created_at']
@@ -223,24 +295,28 @@ class MeetingVideoAdmin(admin.ModelAdmin):
     
     def delete_queryset(self, request, queryset):
         """Override bulk delete to show confirmation"""
-        videos_count = queryset.count()
+        # Videos have no files or signals, so delete() takes the fast path and reports the row count
+        videos_count, _ = queryset.delete()
         self.message_user(
             request, 
             f'تم حذف {videos_count} فيديو لقاء.',
             level='INFO'
         )
-        super().delete_queryset(request, queryset)
 
 
 @admin.register(Colleague)
 class ColleagueAdmin(admin.ModelAdmin):
     """Admin interface for Colleague model"""
-    list_display = ['name', 'status', 'current_workplace', 'is_featured', 'created_at']
+    list_display = ['name', 'status', 'current_workplace', 'archive_count', 'is_featured', 'created_at']
     list_filter = ['status', 'is_featured', 'created_at']
+    # Skip the extra unfiltered COUNT(*) (a GROUP BY subquery with the annotation) and cap page size
+    show_full_result_count = False
+    list_per_page = 50
     search_fields = ['name', 'position', 'current_workplace', 'description', 'achievements']
     list_editable = ['is_featured']
     ordering = ['name']
     readonly_fields = ['created_at', 'updated_at']
+    actions = ['clear_deceased_fields']
     
     fieldsets = [
         ('المعلومات الأساسية', {
@@ -269,9 +345,19 @@ class ColleagueAdmin(admin.ModelAdmin):
     ]
     
     def get_queryset(self, request):
-        """Optimize queryset"""
-        qs = super().get_queryset(request)
-        return qs.select_related()
+        """Annotate archive photo counts to prevent N+1 queries in the changelist"""
+        qs = super().get_queryset(request).annotate(_archive_count=Count('archive_photos'))
+        # Long text columns are never displayed in the changelist - skip them there only,
+        # the change form (get_object) still loads the full row
+        match = getattr(request, 'resolver_match', None)
+        if match and match.url_name == f'{self.opts.app_label}_{self.opts.model_name}_changelist':
+            qs = qs.defer('description', 'achievements', 'contact_info')
+        return qs
+    
+    def archive_count(self, obj):
+        return obj._archive_count
+    archive_count.short_description = 'صور الأرشيف'
+    archive_count.admin_order_field = '_archive_count'
     
     def save_model(self, request, obj, form, change):
         """Auto-clear deceased fields if status is not deceased"""
@@ -281,6 +367,23 @@ class ColleagueAdmin(admin.ModelAdmin):
             obj.relationship_type = None
         super().save_model(request, obj, form, change)
     
+    @admin.action(description='مسح بيانات الوفاة للزملاء غير المتوفين')
+    def clear_deceased_fields(self, request, queryset):
+        """Bulk version of the save_model cleanup - a single UPDATE for all selected rows"""
+        updated = queryset.exclude(status='deceased').update(
+            death_year=None,
+            relative_phone=None,
+            relationship_type=None,
+            updated_at=timezone.now()  # update() bypasses auto_now
+        )
+        # update() skips post_save too, so drop what its handlers would have invalidated
+        transaction.on_commit(lambda: cache.delete_many([DASHBOARD_STATS_CACHE_KEY, COLLEAGUES_VERSION_CACHE_KEY]))
+        self.message_user(
+            request,
+            f'تم مسح بيانات الوفاة لـ {updated} زميل.',
+            level='INFO'
+        )
+    
     def delete_model(self, request, obj):
         """Override delete to show warning about file deletion"""
         colleague_name = obj.name
@@ -303,10 +406,18 @@ class ColleagueAdmin(admin.ModelAdmin):
     
     def delete_queryset(self, request, queryset):
         """Override bulk delete to show warning about file deletion"""
-        colleagues_count = queryset.count()
-        photos_count = queryset.exclude(photo='').count()
+        stats = queryset.aggregate(
+            total=Count('id'),
+            with_photo=Count('id', filter=~Q(photo='') & Q(photo__isnull=False))
+        )
+        colleagues_count = stats['total']
+        photos_count = stats['with_photo']
         
-        super().delete_queryset(request, queryset)
+        # Archive images cascade at the ORM level only, so remove them explicitly
+        # before the raw delete of the colleagues themselves
+        with transaction.atomic():
+            raw_delete_with_files(ColleagueArchiveImage.objects.filter(colleague__in=queryset), ['image'])
+            raw_delete_with_files(queryset, ['photo', 'photo_1973', 'latest_photo'])
         
         if photos_count > 0:
             self.message_user(
@@ -327,6 +438,7 @@ class ColleagueArchiveImageAdmin(admin.ModelAdmin):
     """Admin interface for ColleagueArchiveImage model"""
     list_display = ['colleague', 'uploaded_at', 'uploaded_by']
     list_filter = ['uploaded_at', 'colleague']
+    list_select_related = ['colleague', 'uploaded_by']
     search_fields = ['colleague__name']
     ordering = ['-uploaded_at']
     readonly_fields = ['uploaded_at', 'uploaded_by']
@@ -353,8 +465,7 @@ class ColleagueArchiveImageAdmin(admin.ModelAdmin):
     
     def delete_queryset(self, request, queryset):
         """Override bulk delete to show warning about file deletion"""
-        images_count = queryset.count()
-        super().delete_queryset(request, queryset)
+        images_count = raw_delete_with_files(queryset, ['image'])
         self.message_user(
             request, 
             f'تم حذف {images_count} صورة أرشيف وملفاتها من المجلد.',
@@ -1,4 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import pre_migrate
+
+
+def create_trigram_extension(using, **kwargs):
+    """
+    The trigram GIN indexes need pg_trgm. Migration 0027 creates it, but tables built
+    without migrations (the test database) are created before any migration runs
+    """
+    from django.db import connections
+    connection = connections[using]
+    if connection.vendor == 'postgresql':
+        with connection.cursor() as cursor:
+            cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
 
 
 class ApiConfig(AppConfig):
@@ -8,3 +21,5 @@ class ApiConfig(AppConfig):
     def ready(self):
         # Import signal handlers to ensure they are connected
         import api.models
+        import api.authentication
+        pre_migrate.connect(create_trigram_extension, sender=self)
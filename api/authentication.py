@@ -0,0 +1,48 @@
+"""
+Token authentication with the user/token lookup cached
+"""
+import hashlib
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.authtoken.models import Token
+
+
+def token_cache_key(key):
+    return 'auth:tok:' + hashlib.sha256(key.encode()).hexdigest()
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that keeps the resolved (user, token) pair in the cache for
+    AUTH_TOKEN_CACHE_TIMEOUT seconds, saving the token + user query on every request.
+    Invalid keys and inactive users are not cached and still raise AuthenticationFailed.
+    """
+
+    def authenticate_credentials(self, key):
+        timeout = settings.AUTH_TOKEN_CACHE_TIMEOUT
+        if not timeout:
+            return super().authenticate_credentials(key)
+        lookup = super().authenticate_credentials
+        return cache.get_or_set(token_cache_key(key), lambda: lookup(key), timeout)
+
+
+@receiver(post_save, sender=Token)
+@receiver(post_delete, sender=Token)
+def token_cache_invalidation_handler(sender, instance, **kwargs):
+    """Forget the cached credentials of a changed or revoked token"""
+    cache.delete(token_cache_key(instance.key))
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_token_cache_invalidation_handler(sender, instance, **kwargs):
+    """Forget cached credentials when the user behind them changes (is_active, is_superuser, ...)"""
+    if kwargs.get('update_fields') == frozenset({'last_login'}):
+        return  # Login bookkeeping doesn't change what the token grants
+    keys = Token.objects.filter(user_id=instance.pk).values_list('key', flat=True)
+    cache.delete_many([token_cache_key(key) for key in keys])
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from django.core.management.base import BaseCommand
 from django.db.models import Count
 from api.models import Colleague
@@ -33,20 +34,30 @@ class Command(BaseCommand):
             f'\n⚠ Found {len(duplicates)} duplicate name(s):\n'
         ))
         
+        # Fetch all duplicated colleagues in a single query and group them in memory
+        duplicates = list(duplicates)
+        dup_names = [dup['lower_name'] for dup in duplicates]
+        groups = defaultdict(list)
+        rows = (
+            Colleague.objects
+            .annotate(lower_name=Lower('name'))
+            .filter(lower_name__in=dup_names)
+            .values('id', 'name', 'status', 'created_at', 'lower_name')
+        )
+        for row in rows:
+            groups[row['lower_name']].append(row)
+        
         total_duplicates = 0
         for dup in duplicates:
             name_lower = dup['lower_name']
             count = dup['count']
             total_duplicates += count - 1
             
-            # Get all colleagues with this name
-            colleagues = Colleague.objects.filter(name__iexact=name_lower)
-            
             self.stdout.write(self.style.WARNING(f'\nName: "{name_lower}" ({count} instances)'))
-            for colleague in colleagues:
+            for colleague in groups[name_lower]:
                 self.stdout.write(
-                    f'  - ID: {colleague.id}, Name: "{colleague.name}", '
-                    f'Status: {colleague.status}, Created: {colleague.created_at}'
+                    f'  - ID: {colleague["id"]}, Name: "{colleague["name"]}", '
+                    f'Status: {colleague["status"]}, Created: {colleague["created_at"]}'
                 )
         
         self.stdout.write(self.style.WARNING(
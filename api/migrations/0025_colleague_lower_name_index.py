@@ -0,0 +1,18 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:00
+
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0024_remove_title_ar_from_photos'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='colleague',
+            index=models.Index(django.db.models.functions.text.Lower('name'), name='colleague_lower_name_idx'),
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-15 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0025_colleague_lower_name_index'),
+    ]
+
+    operations = [
+        # (category, is_featured, -created_at) serves the admin filter + ordering path
+        # and covers every query the old (category, is_featured) index did
+        migrations.RemoveIndex(
+            model_name='memoryphoto',
+            name='memory_cat_featured_idx',
+        ),
+        migrations.AddIndex(
+            model_name='memoryphoto',
+            index=models.Index(fields=['category', 'is_featured', '-created_at'], name='memory_cat_feat_date_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='meetingphoto',
+            name='meeting_cat_featured_idx',
+        ),
+        migrations.AddIndex(
+            model_name='meetingphoto',
+            index=models.Index(fields=['category', 'is_featured', '-created_at'], name='meeting_cat_feat_date_idx'),
+        ),
+    ]
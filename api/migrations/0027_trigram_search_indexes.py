@@ -0,0 +1,37 @@
+# Generated by Django 5.2.6 on 2026-10-15 13:00
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0026_photo_category_featured_date_index'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='memoryphoto',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description_ar'), name='gin_trgm_ops'), name='memory_photo_desc_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meetingphoto',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('description_ar'), name='gin_trgm_ops'), name='meeting_photo_desc_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='colleague',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='colleague_name_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='colleague',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('position'), name='gin_trgm_ops'), name='colleague_position_trgm_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='colleague',
+            index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('current_workplace'), name='gin_trgm_ops'), name='colleague_workplace_trgm_idx'),
+        ),
+    ]
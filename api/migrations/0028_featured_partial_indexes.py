@@ -0,0 +1,53 @@
+# Generated by Django 5.2.6 on 2026-10-15 13:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0027_trigram_search_indexes'),
+    ]
+
+    operations = [
+        # Drop low-cardinality boolean indexes in favour of partial indexes on the featured rows
+        migrations.AlterField(
+            model_name='memoryphoto',
+            name='is_featured',
+            field=models.BooleanField(default=False, verbose_name='صورة مميزة'),
+        ),
+        migrations.AlterField(
+            model_name='meetingphoto',
+            name='is_featured',
+            field=models.BooleanField(default=False, verbose_name='صورة مميزة'),
+        ),
+        migrations.AlterField(
+            model_name='meetingvideo',
+            name='is_featured',
+            field=models.BooleanField(default=False, verbose_name='فيديو مميز'),
+        ),
+        migrations.RemoveIndex(
+            model_name='memoryphoto',
+            name='memory_featured_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='memoryphoto',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-created_at'], name='memory_featured_partial_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='meetingphoto',
+            name='meeting_featured_date_idx',
+        ),
+        migrations.AddIndex(
+            model_name='meetingphoto',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-created_at'], name='meeting_featured_partial_idx'),
+        ),
+        migrations.RemoveIndex(
+            model_name='meetingvideo',
+            name='meeting_video_featured_idx',
+        ),
+        migrations.AddIndex(
+            model_name='meetingvideo',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['-created_at'], name='meeting_video_feat_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.2.6 on 2026-10-15 14:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0028_featured_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='memorycategory',
+            index=models.Index(fields=['-year', 'name'], name='memory_cat_year_name_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='meetingcategory',
+            index=models.Index(fields=['-year', 'name'], name='meeting_cat_year_name_idx'),
+        ),
+    ]
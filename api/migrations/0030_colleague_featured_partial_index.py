@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-15 14:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0029_category_year_name_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='colleague',
+            name='is_featured',
+            field=models.BooleanField(default=False, verbose_name='مميز'),
+        ),
+        migrations.RemoveIndex(
+            model_name='colleague',
+            name='colleague_featured_name_idx',
+        ),
+        migrations.AddIndex(
+            model_name='colleague',
+            index=models.Index(condition=models.Q(('is_featured', True)), fields=['name'], name='colleague_featured_partial_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.2.6 on 2026-10-15 15:10
+
+from django.db import migrations, models
+from django.db.models.functions import Coalesce
+
+
+def backfill_photos_count(apps, schema_editor):
+    for model_name in ('MemoryCategory', 'MeetingCategory'):
+        category_model = apps.get_model('api', model_name)
+        photo_model = category_model._meta.get_field('photos').related_model
+        counts = (
+            photo_model.objects.filter(category=models.OuterRef('pk'))
+            .order_by().values('category').annotate(n=models.Count('pk')).values('n')
+        )
+        category_model.objects.update(photos_count=Coalesce(models.Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0030_colleague_featured_partial_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memorycategory',
+            name='photos_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='عدد الصور'),
+        ),
+        migrations.AddField(
+            model_name='meetingcategory',
+            name='photos_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='عدد الصور'),
+        ),
+        migrations.RunPython(backfill_photos_count, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,40 @@
+# Generated by Django 5.2.6 on 2026-10-15 15:40
+
+import django.db.models.functions.text
+from django.db import migrations, models
+from django.db.models import Count
+from django.db.models.functions import Lower
+
+
+def check_no_duplicate_names(apps, schema_editor):
+    Colleague = apps.get_model('api', 'Colleague')
+    duplicates = (
+        Colleague.objects.values(lower_name=Lower('name'))
+        .annotate(count=Count('id')).filter(count__gt=1)
+        .values_list('lower_name', flat=True)
+    )
+    names = list(duplicates[:10])
+    if names:
+        raise RuntimeError(
+            'Cannot add colleague_name_ci_unique: duplicate colleague names exist '
+            f'({", ".join(names)}). Run "python manage.py check_duplicate_colleagues" and resolve them first.'
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0031_category_photos_count'),
+    ]
+
+    operations = [
+        migrations.RunPython(check_no_duplicate_names, migrations.RunPython.noop),
+        migrations.RemoveIndex(
+            model_name='colleague',
+            name='colleague_lower_name_idx',
+        ),
+        migrations.AddConstraint(
+            model_name='colleague',
+            constraint=models.UniqueConstraint(django.db.models.functions.text.Lower('name'), name='colleague_name_ci_unique', violation_error_message='هذا الزميل مسجل مسبقا في النظام. الرجاء التأكد من عدم التكرار.'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.6 on 2026-10-15 16:20
+
+from django.core.files.storage import default_storage
+from django.db import migrations, models
+
+# Same mapping as api.models.FILE_FIELDS, frozen for this migration
+FILE_FIELDS = {
+    'MemoryPhoto': ('image', 'thumbnail'),
+    'MeetingPhoto': ('image', 'thumbnail'),
+    'Colleague': ('photo', 'photo_1973', 'latest_photo'),
+    'ColleagueArchiveImage': ('image',),
+}
+
+
+def backfill_file_size(apps, schema_editor):
+    for model_name, field_names in FILE_FIELDS.items():
+        model = apps.get_model('api', model_name)
+        batch = []
+        for obj in model.objects.only('pk', *field_names).iterator(chunk_size=500):
+            total = 0
+            for field_name in field_names:
+                name = getattr(obj, field_name).name
+                if name:
+                    try:
+                        total += default_storage.size(name)
+                    except OSError:
+                        pass  # File is missing from storage
+            obj.file_size = total
+            batch.append(obj)
+            if len(batch) >= 500:
+                model.objects.bulk_update(batch, ['file_size'])
+                batch = []
+        if batch:
+            model.objects.bulk_update(batch, ['file_size'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0032_colleague_name_ci_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memoryphoto',
+            name='file_size',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='حجم الملفات'),
+        ),
+        migrations.AddField(
+            model_name='meetingphoto',
+            name='file_size',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='حجم الملفات'),
+        ),
+        migrations.AddField(
+            model_name='colleague',
+            name='file_size',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='حجم الملفات'),
+        ),
+        migrations.AddField(
+            model_name='colleaguearchiveimage',
+            name='file_size',
+            field=models.PositiveBigIntegerField(default=0, editable=False, verbose_name='حجم الملفات'),
+        ),
+        migrations.RunPython(backfill_file_size, migrations.RunPython.noop),
+    ]
@@ -1,24 +1,51 @@
 from django.db import models
+from django.db.models.functions import Lower, Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.contrib.auth.models import User
 from django.utils import timezone
-import os
+from concurrent.futures import ThreadPoolExecutor
 from django.conf import settings
-from django.db.models.signals import post_delete, pre_delete
+from django.core.cache import cache
+from django.core.files.storage import default_storage
+from django.db import transaction
+from django.db.models.functions import Coalesce
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 from django.dispatch import receiver
 
+class CategoryQuerySet(models.QuerySet):
+    """QuerySet helpers shared by the photo category models"""
+    
+    def refresh_photos_count(self):
+        """Recompute the stored photos_count from the photo table in a single UPDATE"""
+        photo_model = self.model._meta.get_field('photos').related_model
+        counts = (
+            photo_model.objects.filter(category=models.OuterRef('pk'))
+            .order_by().values('category').annotate(n=models.Count('pk')).values('n')
+        )
+        return self.update(photos_count=Coalesce(models.Subquery(counts), 0))
+
+
 class MemoryCategory(models.Model):
     """Model for memory photo categories (صور تذكارية)"""
     name = models.CharField(max_length=100, verbose_name="اسم الفئة")
     description = models.TextField(blank=True, null=True, verbose_name="وصف الفئة")
     color = models.CharField(max_length=7, default="#3B82F6", verbose_name="لون الفئة")
     year = models.IntegerField(blank=True, null=True, verbose_name="السنة")
+    # Denormalized counter kept in sync by the photo signals below, so lists need no COUNT/JOIN
+    photos_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="عدد الصور")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="تاريخ التحديث")
     
+    objects = CategoryQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "فئة صور تذكارية"
         verbose_name_plural = "فئات الصور التذكارية"
         ordering = ['-year', 'name']  # Sort by year descending (newest first), then by name
+        indexes = [
+            # Matches the default ORDER BY exactly, so category lists avoid an in-memory sort
+            models.Index(fields=['-year', 'name'], name='memory_cat_year_name_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -30,10 +57,12 @@ class MemoryPhoto(models.Model):
     description_ar = models.TextField(blank=True, null=True, verbose_name="وصف الصورة")
     image = models.ImageField(upload_to='memory_photos/', verbose_name="الصورة")
     thumbnail = models.ImageField(upload_to='memory_thumbnails/', blank=True, null=True, verbose_name="صورة مصغرة")
-    is_featured = models.BooleanField(default=False, verbose_name="صورة مميزة", db_index=True)
+    is_featured = models.BooleanField(default=False, verbose_name="صورة مميزة")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء", db_index=True)
     updated_at = models.DateTimeField(auto_now=True, verbose_name="تاريخ التحديث")
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="رفع بواسطة")
+    # Combined bytes of this row's files, kept by a pre_save signal so storage totals are a SUM
+    file_size = models.PositiveBigIntegerField(default=0, editable=False, verbose_name="حجم الملفات")
     
     class Meta:
         verbose_name = "صورة تذكارية"
@@ -42,8 +71,11 @@ class MemoryPhoto(models.Model):
         indexes = [
             models.Index(fields=['-created_at'], name='memory_photo_created_idx'),
             models.Index(fields=['category', '-created_at'], name='memory_cat_date_idx'),
-            models.Index(fields=['category', 'is_featured'], name='memory_cat_featured_idx'),
-            models.Index(fields=['is_featured', '-created_at'], name='memory_featured_date_idx'),
+            models.Index(fields=['category', 'is_featured', '-created_at'], name='memory_cat_feat_date_idx'),
+            # Partial index: only the (few) featured rows are indexed - a boolean leading column is rarely selective
+            models.Index(fields=['-created_at'], condition=models.Q(is_featured=True), name='memory_featured_partial_idx'),
+            # Trigram index for icontains search (Django compiles it to UPPER(col) LIKE UPPER(%s))
+            GinIndex(OpClass(Upper('description_ar'), name='gin_trgm_ops'), name='memory_photo_desc_trgm_idx'),
         ]
     
     def __str__(self):
@@ -57,13 +89,21 @@ class MeetingCategory(models.Model):
     color = models.CharField(max_length=7, default="#10B981", verbose_name="لون الفئة")
     year = models.IntegerField(blank=True, null=True, verbose_name="السنة")
     youtube_link = models.URLField(blank=True, null=True, verbose_name="رابط يوتيوب")
+    # Denormalized counter kept in sync by the photo signals below, so lists need no COUNT/JOIN
+    photos_count = models.PositiveIntegerField(default=0, editable=False, verbose_name="عدد الصور")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="تاريخ التحديث")
     
+    objects = CategoryQuerySet.as_manager()
+    
     class Meta:
         verbose_name = "فئة اللقاءات"
         verbose_name_plural = "فئات اللقاءات"
         ordering = ['-year', 'name']  # Sort by year descending (newest first), then by name
+        indexes = [
+            # Matches the default ORDER BY exactly, so category lists avoid an in-memory sort
+            models.Index(fields=['-year', 'name'], name='meeting_cat_year_name_idx'),
+        ]
     
     def __str__(self):
         return self.name
@@ -75,10 +115,12 @@ class MeetingPhoto(models.Model):
     description_ar = models.TextField(blank=True, null=True, verbose_name="وصف صورة اللقاء")
     image = models.ImageField(upload_to='meeting_photos/', verbose_name="صورة اللقاء")
     thumbnail = models.ImageField(upload_to='meeting_thumbnails/', blank=True, null=True, verbose_name="صورة مصغرة")
-    is_featured = models.BooleanField(default=False, verbose_name="صورة مميزة", db_index=True)
+    is_featured = models.BooleanField(default=False, verbose_name="صورة مميزة")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء", db_index=True)
     updated_at = models.DateTimeField(auto_now=True, verbose_name="تاريخ التحديث")
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="رفع بواسطة")
+    # Combined bytes of this row's files, kept by a pre_save signal so storage totals are a SUM
+    file_size = models.PositiveBigIntegerField(default=0, editable=False, verbose_name="حجم الملفات")
     
     class Meta:
         verbose_name = "صورة اللقاء"
@@ -87,8 +129,11 @@ class MeetingPhoto(models.Model):
         indexes = [
             models.Index(fields=['-created_at'], name='meeting_photo_created_idx'),
             models.Index(fields=['category', '-created_at'], name='meeting_cat_date_idx'),
-            models.Index(fields=['category', 'is_featured'], name='meeting_cat_featured_idx'),
-            models.Index(fields=['is_featured', '-created_at'], name='meeting_featured_date_idx'),
+            models.Index(fields=['category', 'is_featured', '-created_at'], name='meeting_cat_feat_date_idx'),
+            # Partial index: only the (few) featured rows are indexed - a boolean leading column is rarely selective
+            models.Index(fields=['-created_at'], condition=models.Q(is_featured=True), name='meeting_featured_partial_idx'),
+            # Trigram index for icontains search (Django compiles it to UPPER(col) LIKE UPPER(%s))
+            GinIndex(OpClass(Upper('description_ar'), name='gin_trgm_ops'), name='meeting_photo_desc_trgm_idx'),
         ]
     
     def __str__(self):
@@ -100,7 +145,7 @@ class MeetingVideo(models.Model):
     category = models.ForeignKey(MeetingCategory, on_delete=models.CASCADE, related_name='videos', verbose_name="فئة اللقاء", db_index=True)
     description_ar = models.TextField(blank=True, null=True, verbose_name="وصف الفيديو")
     youtube_url = models.URLField(max_length=500, verbose_name="رابط يوتيوب")
-    is_featured = models.BooleanField(default=False, verbose_name="فيديو مميز", db_index=True)
+    is_featured = models.BooleanField(default=False, verbose_name="فيديو مميز")
     sort_order = models.IntegerField(default=0, verbose_name="ترتيب العرض")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء", db_index=True)
     updated_at = models.DateTimeField(auto_now=True, verbose_name="تاريخ التحديث")
@@ -113,13 +158,17 @@ class MeetingVideo(models.Model):
         indexes = [
             models.Index(fields=['category', 'sort_order'], name='meeting_video_cat_sort_idx'),
             models.Index(fields=['category', '-created_at'], name='meeting_video_cat_date_idx'),
-            models.Index(fields=['is_featured', '-created_at'], name='meeting_video_featured_idx'),
+            # Partial index: only the (few) featured rows are indexed - a boolean leading column is rarely selective
+            models.Index(fields=['-created_at'], condition=models.Q(is_featured=True), name='meeting_video_feat_partial_idx'),
         ]
     
     def __str__(self):
         return f"Memory Photo {self.id}"
 
 
+COLLEAGUE_DUPLICATE_NAME_MESSAGE = "هذا الزميل مسجل مسبقا في النظام. الرجاء التأكد من عدم التكرار."
+
+
 class Colleague(models.Model):
     """Model for colleagues/alumni"""
     STATUS_CHOICES = [
@@ -136,7 +185,7 @@ class Colleague(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='active', verbose_name="الحالة", db_index=True)
     achievements = models.TextField(blank=True, null=True, verbose_name="الإنجازات")
     contact_info = models.TextField(blank=True, null=True, verbose_name="معلومات التواصل")
-    is_featured = models.BooleanField(default=False, verbose_name="مميز", db_index=True)
+    is_featured = models.BooleanField(default=False, verbose_name="مميز")
     # Fields for deceased colleagues
     death_year = models.IntegerField(blank=True, null=True, verbose_name="سنة الوفاة")
     relative_phone = models.CharField(max_length=20, blank=True, null=True, verbose_name="رقم قريب له")
@@ -153,6 +202,8 @@ class Colleague(models.Model):
     # Structured image system fields
     photo_1973 = models.ImageField(upload_to='colleague_photos/1973/', blank=True, null=True, verbose_name="صورة 1973")
     latest_photo = models.ImageField(upload_to='colleague_photos/latest/', blank=True, null=True, verbose_name="الصورة السنوية الأخيرة")
+    # Combined bytes of this row's files, kept by a pre_save signal so storage totals are a SUM
+    file_size = models.PositiveBigIntegerField(default=0, editable=False, verbose_name="حجم الملفات")
     created_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الإنشاء")
     updated_at = models.DateTimeField(auto_now=True, verbose_name="تاريخ التحديث")
     
@@ -162,7 +213,21 @@ class Colleague(models.Model):
         ordering = ['name']
         indexes = [
             models.Index(fields=['status', 'name'], name='colleague_status_name_idx'),
-            models.Index(fields=['is_featured', 'name'], name='colleague_featured_name_idx'),
+            # Partial index: only featured colleagues are indexed, in display order
+            models.Index(fields=['name'], condition=models.Q(is_featured=True), name='colleague_featured_partial_idx'),
+            # Trigram indexes for icontains search (Django compiles it to UPPER(col) LIKE UPPER(%s))
+            GinIndex(OpClass(Upper('name'), name='gin_trgm_ops'), name='colleague_name_trgm_idx'),
+            GinIndex(OpClass(Upper('position'), name='gin_trgm_ops'), name='colleague_position_trgm_idx'),
+            GinIndex(OpClass(Upper('current_workplace'), name='gin_trgm_ops'), name='colleague_workplace_trgm_idx'),
+        ]
+        constraints = [
+            # Case-insensitive unique names enforced by the database (race-free, no pre-check query);
+            # its unique index on LOWER(name) also serves the duplicate report's GROUP BY
+            models.UniqueConstraint(
+                Lower('name'),
+                name='colleague_name_ci_unique',
+                violation_error_message=COLLEAGUE_DUPLICATE_NAME_MESSAGE,
+            ),
         ]
     
     def __str__(self):
@@ -175,6 +240,8 @@ class ColleagueArchiveImage(models.Model):
     image = models.ImageField(upload_to='colleague_photos/archive/', verbose_name="صورة الأرشيف")
     uploaded_at = models.DateTimeField(auto_now_add=True, verbose_name="تاريخ الرفع", db_index=True)
     uploaded_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True, verbose_name="رفع بواسطة")
+    # Combined bytes of this row's files, kept by a pre_save signal so storage totals are a SUM
+    file_size = models.PositiveBigIntegerField(default=0, editable=False, verbose_name="حجم الملفات")
     
     class Meta:
         verbose_name = "صورة أرشيف زميل"
@@ -190,126 +257,151 @@ class ColleagueArchiveImage(models.Model):
 
 
 # Signal handlers for file deletion
-def delete_file_if_exists(file_path):
+def delete_file_if_exists(file_name):
     """
-    Utility function to safely delete a file from the filesystem
+    Utility function to safely delete a stored file through the storage backend
+    Takes the storage-relative name (field.name), so remote storages work as well
     """
-    if file_path and os.path.isfile(file_path):
+    if file_name:
         try:
-            os.remove(file_path)
+            default_storage.delete(file_name)
         except OSError:
             pass  # File was already deleted or doesn't exist
 
-@receiver(post_delete, sender=MemoryPhoto)
-def memory_photo_delete_handler(sender, instance, **kwargs):
+# Background pool for file cleanup - threads are started lazily, so this is safe with preload_app
+file_cleanup_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='file-cleanup')
+
+def delete_files_if_exist(file_names):
     """
-    Delete memory photo files when MemoryPhoto instance is deleted
-    Uses transaction.on_commit() to avoid race conditions
+    Delete many stored files in the background pool (file removal is I/O-bound)
+    Returns immediately, so deletes do not wait on unlink syscalls or storage round-trips
     """
-    from django.db import transaction
-    
-    # Store paths before they're potentially invalidated
-    image_path = instance.image.path if instance.image else None
-    thumbnail_path = instance.thumbnail.path if instance.thumbnail else None
-    
-    # Schedule file deletion after transaction commits
-    if image_path:
-        transaction.on_commit(lambda: delete_file_if_exists(image_path))
-    if thumbnail_path:
-        transaction.on_commit(lambda: delete_file_if_exists(thumbnail_path))
+    for name in file_names:
+        if name:
+            file_cleanup_executor.submit(delete_file_if_exists, name)
 
-@receiver(pre_delete, sender=MemoryCategory)
-def memory_category_delete_handler(sender, instance, **kwargs):
+# Model -> file fields whose stored files are removed when an instance is deleted
+FILE_FIELDS = {
+    MemoryPhoto: ('image', 'thumbnail'),
+    MeetingPhoto: ('image', 'thumbnail'),
+    Colleague: ('photo', 'photo_1973', 'latest_photo'),
+    ColleagueArchiveImage: ('image',),
+}
+
+def file_delete_handler(sender, instance, **kwargs):
     """
-    Delete all memory photos and their files when MemoryCategory is deleted
+    Delete the stored files of any model listed in FILE_FIELDS when an instance is deleted
     Uses transaction.on_commit() to avoid race conditions
     """
-    from django.db import transaction
+    # Store file names before they're potentially invalidated
+    file_names = []
+    for field_name in FILE_FIELDS[sender]:
+        field_file = getattr(instance, field_name)
+        if field_file:
+            file_names.append(field_file.name)
     
-    # Get all photos in this category before deletion and store their paths
-    file_paths = []
-    photos = instance.photos.all()
-    for photo in photos:
-        if photo.image:
-            file_paths.append(photo.image.path)
-        if photo.thumbnail:
-            file_paths.append(photo.thumbnail.path)
-    
-    # Schedule file deletion after transaction commits
-    for path in file_paths:
-        transaction.on_commit(lambda p=path: delete_file_if_exists(p))
+    # Schedule file deletion in the background after transaction commits
+    if file_names:
+        transaction.on_commit(lambda: delete_files_if_exist(file_names))
 
-@receiver(post_delete, sender=MeetingPhoto)
-def meeting_photo_delete_handler(sender, instance, **kwargs):
+for model in FILE_FIELDS:
+    post_delete.connect(file_delete_handler, sender=model, dispatch_uid=f'file_delete_{model._meta.label_lower}')
+
+def file_size_handler(sender, instance, **kwargs):
     """
-    Delete meeting photo files when MeetingPhoto instance is deleted
-    Uses transaction.on_commit() to avoid race conditions
+    Store the combined size of an instance's files before it is saved
+    New uploads report their size without I/O; already stored files cost one stat() each
     """
-    from django.db import transaction
-    
-    # Store paths before they're potentially invalidated
-    image_path = instance.image.path if instance.image else None
-    thumbnail_path = instance.thumbnail.path if instance.thumbnail else None
-    
-    # Schedule file deletion after transaction commits
-    if image_path:
-        transaction.on_commit(lambda: delete_file_if_exists(image_path))
-    if thumbnail_path:
-        transaction.on_commit(lambda: delete_file_if_exists(thumbnail_path))
+    total = 0
+    for field_name in FILE_FIELDS[sender]:
+        field_file = getattr(instance, field_name)
+        if field_file:
+            try:
+                total += field_file.size
+            except OSError:
+                pass  # File is missing from storage
+    instance.file_size = total
 
+for model in FILE_FIELDS:
+    pre_save.connect(file_size_handler, sender=model, dispatch_uid=f'file_size_{model._meta.label_lower}')
+
+@receiver(pre_delete, sender=MemoryCategory)
 @receiver(pre_delete, sender=MeetingCategory)
-def meeting_category_delete_handler(sender, instance, **kwargs):
+def category_delete_handler(sender, instance, **kwargs):
     """
-    Delete all meeting photos and their files when MeetingCategory is deleted
+    Delete the files of all photos in a category when the category is deleted
     Uses transaction.on_commit() to avoid race conditions
     """
-    from django.db import transaction
-    
-    # Get all photos in this category before deletion and store their paths
-    file_paths = []
-    photos = instance.photos.all()
-    for photo in photos:
-        if photo.image:
-            file_paths.append(photo.image.path)
-        if photo.thumbnail:
-            file_paths.append(photo.thumbnail.path)
+    # Fetch only the file names in one narrow query instead of instantiating every photo,
+    # streamed in chunks (server-side cursor on Postgres) so huge categories don't spike memory
+    file_names = [
+        name
+        for row in instance.photos.values_list('image', 'thumbnail').iterator(chunk_size=1000)
+        for name in row if name
+    ]
     
-    # Schedule file deletion after transaction commits
-    for path in file_paths:
-        transaction.on_commit(lambda p=path: delete_file_if_exists(p))
+    # Schedule file deletion after transaction commits (one callback for the whole category)
+    if file_names:
+        transaction.on_commit(lambda: delete_files_if_exist(file_names))
 
-@receiver(post_delete, sender=Colleague)
-def colleague_delete_handler(sender, instance, **kwargs):
-    """
-    Delete colleague photo files when Colleague instance is deleted
-    Uses transaction.on_commit() to avoid race conditions
-    """
-    from django.db import transaction
-    
-    # Store paths before they're potentially invalidated
-    photo_path = instance.photo.path if instance.photo else None
-    photo_1973_path = instance.photo_1973.path if instance.photo_1973 else None
-    latest_photo_path = instance.latest_photo.path if instance.latest_photo else None
-    
-    # Schedule file deletion after transaction commits
-    if photo_path:
-        transaction.on_commit(lambda: delete_file_if_exists(photo_path))
-    if photo_1973_path:
-        transaction.on_commit(lambda: delete_file_if_exists(photo_1973_path))
-    if latest_photo_path:
-        transaction.on_commit(lambda: delete_file_if_exists(latest_photo_path))
-
-@receiver(post_delete, sender=ColleagueArchiveImage)
-def colleague_archive_image_delete_handler(sender, instance, **kwargs):
-    """
-    Delete archive image file when ColleagueArchiveImage instance is deleted
-    Uses transaction.on_commit() to avoid race conditions
-    """
-    from django.db import transaction
-    
-    # Store path before it's potentially invalidated
-    image_path = instance.image.path if instance.image else None
-    
-    # Schedule file deletion after transaction commits
-    if image_path:
-        transaction.on_commit(lambda: delete_file_if_exists(image_path))
+def adjust_photos_count(category_model, category_id, delta):
+    """Atomically shift a category's stored photos_count by delta (no read-modify-write race)"""
+    if category_id is not None:
+        category_model.objects.filter(pk=category_id).update(
+            photos_count=models.F('photos_count') + delta
+        )
+
+@receiver(pre_save, sender=MemoryPhoto)
+@receiver(pre_save, sender=MeetingPhoto)
+def photo_category_tracker(sender, instance, **kwargs):
+    """Remember the stored category of an existing photo, so a move can update both counters"""
+    if instance._state.adding:
+        instance._previous_category_id = None
+    else:
+        instance._previous_category_id = (
+            sender.objects.filter(pk=instance.pk).values_list('category_id', flat=True).first()
+        )
+
+@receiver(post_save, sender=MemoryPhoto)
+@receiver(post_save, sender=MeetingPhoto)
+def photo_count_save_handler(sender, instance, created, **kwargs):
+    """Increment the category counter on upload, or move it when the photo changes category"""
+    category_model = sender._meta.get_field('category').related_model
+    if created:
+        adjust_photos_count(category_model, instance.category_id, 1)
+        return
+    previous_category_id = getattr(instance, '_previous_category_id', None)
+    if previous_category_id is not None and previous_category_id != instance.category_id:
+        adjust_photos_count(category_model, previous_category_id, -1)
+        adjust_photos_count(category_model, instance.category_id, 1)
+
+@receiver(post_delete, sender=MemoryPhoto)
+@receiver(post_delete, sender=MeetingPhoto)
+def photo_count_delete_handler(sender, instance, **kwargs):
+    """Decrement the category counter when a photo is deleted"""
+    category_model = sender._meta.get_field('category').related_model
+    adjust_photos_count(category_model, instance.category_id, -1)
+
+# Cache key of the dashboard_stats payload (see api.views). Deleting it only reaches other
+# workers with a shared cache (REDIS_URL); otherwise they may serve stats up to its TTL old.
+DASHBOARD_STATS_CACHE_KEY = 'dashboard:stats:v1'
+
+def dashboard_stats_invalidation_handler(sender, **kwargs):
+    """Drop the cached dashboard numbers when content they count changes"""
+    transaction.on_commit(lambda: cache.delete(DASHBOARD_STATS_CACHE_KEY))
+
+for model in (MemoryCategory, MemoryPhoto, MeetingCategory, MeetingPhoto, Colleague, ColleagueArchiveImage):
+    for signal in (post_save, post_delete):
+        signal.connect(dashboard_stats_invalidation_handler, sender=model, dispatch_uid=f'dashboard_stats_{model._meta.label_lower}')
+
+# Cache key of the version the colleague list ETag is built from (see api.views);
+# deleting it makes the next list request start a new version
+COLLEAGUES_VERSION_CACHE_KEY = 'colleagues:version'
+
+def colleagues_version_invalidation_handler(sender, **kwargs):
+    """Start a new colleague list version when a colleague or one of their archive photos changes"""
+    transaction.on_commit(lambda: cache.delete(COLLEAGUES_VERSION_CACHE_KEY))
+
+for model in (Colleague, ColleagueArchiveImage):
+    for signal in (post_save, post_delete):
+        signal.connect(colleagues_version_invalidation_handler, sender=model, dispatch_uid=f'colleagues_version_{model._meta.label_lower}')
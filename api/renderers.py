@@ -0,0 +1,29 @@
+"""
+Fast JSON rendering for API responses
+"""
+import orjson
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF's encoder handles what orjson leaves to `default` (lazy translations, Decimal, QuerySet, ...)
+# and datetimes, so values keep exactly the format the standard renderer produced
+drf_encoder = JSONEncoder()
+
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer backed by orjson - a compiled encoder several times faster than json.dumps
+    on serializer output. Produces the same compact UTF-8 JSON (UNICODE_JSON/COMPACT_JSON);
+    requests asking for indented output are passed to the standard renderer.
+    """
+    
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b''
+        if self.get_indent(accepted_media_type, renderer_context or {}):
+            return super().render(data, accepted_media_type, renderer_context)
+        ret = orjson.dumps(data, default=drf_encoder.default, option=ORJSON_OPTIONS)
+        # Escape the line/paragraph separators like JSONRenderer does: valid in JSON, not in JS
+        return ret.replace(b'\xe2\x80\xa8', b'\\u2028').replace(b'\xe2\x80\xa9', b'\\u2029')
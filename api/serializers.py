@@ -1,10 +1,53 @@
+from django.db import IntegrityError, transaction
 from rest_framework import serializers
-from .models import MemoryCategory, MemoryPhoto, MeetingCategory, MeetingPhoto, MeetingVideo, Colleague, ColleagueArchiveImage
+from .models import (
+    MemoryCategory, MemoryPhoto, MeetingCategory, MeetingPhoto, MeetingVideo, Colleague, ColleagueArchiveImage,
+    COLLEAGUE_DUPLICATE_NAME_MESSAGE
+)
 
-class MemoryCategorySerializer(serializers.ModelSerializer):
-    # Use IntegerField to receive annotated count from queryset
-    photos_count = serializers.IntegerField(read_only=True)
+# Built once at import instead of per row by Model.get_FOO_display()
+COLLEAGUE_STATUS_DISPLAY = dict(Colleague.STATUS_CHOICES)
+
+
+def with_category_name(queryset):
+    """
+    JOIN the category but load only its id and name - all that category_name reads.
+    Deferring columns of the related row leaves saves of the main row unaffected.
+    """
+    category_model = queryset.model._meta.get_field('category').related_model
+    return queryset.select_related('category').defer(*(
+        f'category__{field.name}' for field in category_model._meta.concrete_fields
+        if field.name not in ('id', 'name')
+    ))
+
+
+class AbsoluteMediaURLField(serializers.ReadOnlyField):
+    """
+    Absolute URL of a file field, e.g. image_url = AbsoluteMediaURLField(source='image').
+    The base URL is resolved once per response: it is stored in the serializer context,
+    which nested serializers share with their root (e.g. archive_photos inside a colleague
+    list), and kept on the bound field, so each row costs one string concatenation.
+    """
+    _base_url = None
     
+    def to_representation(self, field_file):
+        if not field_file:
+            return None
+        url = field_file.url
+        if '://' in url:
+            return url  # Storage already returns absolute URLs
+        if self._base_url is None:
+            context = self.context
+            base_url = context.get('media_base_url')
+            if base_url is None:
+                request = context.get('request')
+                if not request:
+                    return None
+                base_url = context['media_base_url'] = request.build_absolute_uri('/')[:-1]
+            self._base_url = base_url
+        return f'{self._base_url}{url}'
+
+class MemoryCategorySerializer(serializers.ModelSerializer):
     class Meta:
         model = MemoryCategory
         fields = [
@@ -16,7 +59,7 @@ class MemoryCategorySerializer(serializers.ModelSerializer):
 
 class MemoryPhotoSerializer(serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
-    image_url = serializers.SerializerMethodField()
+    image_url = AbsoluteMediaURLField(source='image')
     
     class Meta:
         model = MemoryPhoto
@@ -27,12 +70,14 @@ class MemoryPhotoSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'uploaded_by']
     
-    def get_image_url(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-        return None
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        JOIN the category so category_name does not trigger a query per row.
+        Only category.name is read, and uploaded_by is serialized as a primary key,
+        so the other category columns and the auth_user row are kept off the wire.
+        """
+        return with_category_name(queryset)
     
     def create(self, validated_data):
         # Set the uploaded_by field to the current user
@@ -43,6 +88,21 @@ class MemoryPhotoSerializer(serializers.ModelSerializer):
 
 
 class MemoryCategoryDetailSerializer(serializers.ModelSerializer):
+    # Photos are served page by page from the photos action instead of being nested here,
+    # so the detail response size no longer grows with the category
+    photos_url = serializers.HyperlinkedIdentityField(view_name='memorycategory-photos')
+    
+    class Meta:
+        model = MemoryCategory
+        fields = [
+            'id', 'name', 'description', 'color', 'created_at', 'updated_at',
+            'photos_count', 'photos_url'
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at', 'photos_count']
+
+
+class MemoryCategoryWithPhotosSerializer(serializers.ModelSerializer):
+    """Category with all of its photos nested - only for the with_photos bulk endpoint"""
     photos = MemoryPhotoSerializer(many=True, read_only=True)
     
     class Meta:
@@ -55,9 +115,6 @@ class MemoryCategoryDetailSerializer(serializers.ModelSerializer):
 
 
 class MeetingCategorySerializer(serializers.ModelSerializer):
-    # Use IntegerField to receive annotated count from queryset
-    photos_count = serializers.IntegerField(read_only=True)
-    
     class Meta:
         model = MeetingCategory
         fields = [
@@ -69,7 +126,7 @@ class MeetingCategorySerializer(serializers.ModelSerializer):
 
 class MeetingPhotoSerializer(serializers.ModelSerializer):
     category_name = serializers.CharField(source='category.name', read_only=True)
-    image_url = serializers.SerializerMethodField()
+    image_url = AbsoluteMediaURLField(source='image')
     
     class Meta:
         model = MeetingPhoto
@@ -80,12 +137,14 @@ class MeetingPhotoSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'uploaded_by']
     
-    def get_image_url(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-        return None
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        JOIN the category so category_name does not trigger a query per row.
+        Only category.name is read, and uploaded_by is serialized as a primary key,
+        so the other category columns and the auth_user row are kept off the wire.
+        """
+        return with_category_name(queryset)
     
     def create(self, validated_data):
         # Set the uploaded_by field to the current user
@@ -96,6 +155,21 @@ class MeetingPhotoSerializer(serializers.ModelSerializer):
 
 
 class MeetingCategoryDetailSerializer(serializers.ModelSerializer):
+    # Photos are served page by page from the photos action instead of being nested here,
+    # so the detail response size no longer grows with the category
+    photos_url = serializers.HyperlinkedIdentityField(view_name='meetingcategory-photos')
+    
+    class Meta:
+        model = MeetingCategory
+        fields = [
+            'id', 'name', 'description', 'color', 'year', 'youtube_link', 'created_at', 'updated_at',
+            'photos_count', 'photos_url'
+        ]
+        read_only_fields = ['id', 'created_at', 'updated_at', 'photos_count']
+
+
+class MeetingCategoryWithPhotosSerializer(serializers.ModelSerializer):
+    """Category with all of its photos nested - only for the with_photos bulk endpoint"""
     photos = MeetingPhotoSerializer(many=True, read_only=True)
     
     class Meta:
@@ -119,6 +193,11 @@ class MeetingVideoSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'added_by']
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """JOIN only what category_name needs; added_by is serialized as a primary key"""
+        return with_category_name(queryset)
+    
     def create(self, validated_data):
         # Set the added_by field to the current user
         request = self.context.get('request')
@@ -129,26 +208,19 @@ class MeetingVideoSerializer(serializers.ModelSerializer):
 
 class ColleagueArchiveImageSerializer(serializers.ModelSerializer):
     """Serializer for archive images"""
-    image_url = serializers.SerializerMethodField()
+    image_url = AbsoluteMediaURLField(source='image')
     
     class Meta:
         model = ColleagueArchiveImage
         fields = ['id', 'image', 'image_url', 'uploaded_at', 'uploaded_by']
         read_only_fields = ['id', 'uploaded_at', 'uploaded_by']
-    
-    def get_image_url(self, obj):
-        if obj.image:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.image.url)
-        return None
 
 
 class ColleagueSerializer(serializers.ModelSerializer):
-    photo_url = serializers.SerializerMethodField()
-    photo_1973_url = serializers.SerializerMethodField()
-    latest_photo_url = serializers.SerializerMethodField()
-    status_display = serializers.CharField(source='get_status_display', read_only=True)
+    photo_url = AbsoluteMediaURLField(source='photo')
+    photo_1973_url = AbsoluteMediaURLField(source='photo_1973')
+    latest_photo_url = AbsoluteMediaURLField(source='latest_photo')
+    status_display = serializers.SerializerMethodField()
     archive_photos = ColleagueArchiveImageSerializer(many=True, read_only=True)
     
     class Meta:
@@ -163,49 +235,42 @@ class ColleagueSerializer(serializers.ModelSerializer):
         ]
         read_only_fields = ['id', 'created_at', 'updated_at', 'archive_photos']
     
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """
+        Load every colleague's archive photos in one extra query instead of one per row.
+        The nested serializer emits uploaded_by as a primary key, so no user JOIN is needed.
+        """
+        return queryset.prefetch_related('archive_photos')
+    
     def validate_name(self, value):
         """
-        Validate that colleague name is unique (case-insensitive).
-        This prevents duplicate names while being production-friendly and preserving existing data.
+        Validate and normalize the colleague name.
+        Case-insensitive uniqueness is enforced by the colleague_name_ci_unique constraint
+        at save time (see save_unique_name), so no lookup query is needed here.
         """
         if not value:
             raise serializers.ValidationError("الاسم مطلوب.")
         
-        # Normalize the name for comparison (strip whitespace, case-insensitive)
-        normalized_name = value.strip()
-        
-        # Check for existing colleague with the same name (case-insensitive)
-        # Exclude the current instance when updating
-        existing_query = Colleague.objects.filter(name__iexact=normalized_name)
-        
-        # If updating, exclude the current instance
-        if self.instance:
-            existing_query = existing_query.exclude(pk=self.instance.pk)
-        
-        if existing_query.exists():
-            raise serializers.ValidationError(
-                "هذا الزميل مسجل مسبقا في النظام. الرجاء التأكد من عدم التكرار."
-            )
-        
-        return normalized_name
-    
-    def get_photo_url(self, obj):
-        if obj.photo:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.photo.url)
-        return None
-    
-    def get_photo_1973_url(self, obj):
-        if obj.photo_1973:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.photo_1973.url)
-        return None
-    
-    def get_latest_photo_url(self, obj):
-        if obj.latest_photo:
-            request = self.context.get('request')
-            if request:
-                return request.build_absolute_uri(obj.latest_photo.url)
-        return None
\ No newline at end of file
+        # Normalize the name (strip whitespace) so the stored value is what the constraint compares
+        return value.strip()
+    
+    def save_unique_name(self, save, *args):
+        """Run a create/update and report a duplicate name as a field error instead of a 500"""
+        try:
+            # Savepoint, so a violation does not break an enclosing transaction
+            with transaction.atomic():
+                return save(*args)
+        except IntegrityError as e:
+            if 'colleague_name_ci_unique' not in str(e):
+                raise
+            raise serializers.ValidationError({'name': [COLLEAGUE_DUPLICATE_NAME_MESSAGE]})
+    
+    def create(self, validated_data):
+        return self.save_unique_name(super().create, validated_data)
+    
+    def update(self, instance, validated_data):
+        return self.save_unique_name(super().update, instance, validated_data)
+    
+    def get_status_display(self, obj):
+        return COLLEAGUE_STATUS_DISPLAY.get(obj.status, obj.status)
\ No newline at end of file
@@ -1,3 +1,678 @@
-from django.test import TestCase
+import io
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from importlib import import_module
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from django.apps import apps as django_apps
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.core.management import call_command
+from django.core.files.storage import FileSystemStorage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import DEFAULT_DB_ALIAS, DatabaseError, connection, connections
+from django.test import Client, SimpleTestCase, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from PIL import Image
+from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import NotFound
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from .models import (
+    DASHBOARD_STATS_CACHE_KEY, Colleague, ColleagueArchiveImage, MemoryCategory, MemoryPhoto, MeetingCategory, MeetingPhoto,
+    delete_file_if_exists
+)
+from .renderers import ORJSONRenderer
+from .utils.image_processing import process_image
+from .validators import find_invalid_upload, sniff_image_type, validate_uploaded_image
+from .views import (
+    BULK_UPLOAD_CONCURRENCY, LOGIN_FAILURE_LIMIT, LoginRateThrottle, StandardResultsSetPagination, advisory_slot_keys
+)
+
+MEDIA_ROOT = tempfile.mkdtemp(prefix='api-tests-media-')
+
+
+def make_image(name='photo.png'):
+    """A small valid PNG upload"""
+    buffer = io.BytesIO()
+    Image.new('RGB', (8, 8), '#3B82F6').save(buffer, format='PNG')
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type='image/png')
+
+
+@override_settings(MEDIA_ROOT=MEDIA_ROOT)
+class APITestCase(TestCase):
+    """Uploads go to a temporary MEDIA_ROOT and every test starts with an empty cache"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        os.makedirs(MEDIA_ROOT, exist_ok=True)
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        shutil.rmtree(MEDIA_ROOT, ignore_errors=True)
+
+    def setUp(self):
+        cache.clear()
+        self.client = APIClient()
+
+
+class CategoryPhotosActionTests(APITestCase):
+    """GET /<categories>/<pk>/photos/ pages one category's photos by created_at"""
+
+    def assert_photos_paginated(self, url_prefix, category_model, photo_model):
+        category = category_model.objects.create(name='الرحلة')
+        other = category_model.objects.create(name='أخرى')
+        photos = [photo_model.objects.create(category=category, image=make_image()) for _ in range(3)]
+        photo_model.objects.create(category=other, image=make_image())
+
+        response = self.client.get(f'/api/{url_prefix}/{category.pk}/photos/', {'page_size': 2})
+        self.assertEqual(response.status_code, 200)
+        first_page = response.json()
+        self.assertEqual([p['id'] for p in first_page['results']], [photos[2].pk, photos[1].pk])
+        self.assertIsNotNone(first_page['next'])
+
+        response = self.client.get(first_page['next'])
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([p['id'] for p in response.json()['results']], [photos[0].pk])
+
+    def test_memory_category_photos(self):
+        self.assert_photos_paginated('memory-categories', MemoryCategory, MemoryPhoto)
+
+    def test_meeting_category_photos(self):
+        self.assert_photos_paginated('meeting-categories', MeetingCategory, MeetingPhoto)
+
+
+class PhotosCountTests(APITestCase):
+    """The stored photos_count follows photo creates, moves and deletes, including admin bulk deletes"""
+
+    def setUp(self):
+        super().setUp()
+        self.category = MemoryCategory.objects.create(name='الرحلة')
+        self.other = MemoryCategory.objects.create(name='أخرى')
+        self.admin = Client()
+        self.admin.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+
+    def assert_counts(self, category_count, other_count):
+        self.category.refresh_from_db()
+        self.other.refresh_from_db()
+        self.assertEqual((self.category.photos_count, self.other.photos_count), (category_count, other_count))
+
+    def test_create_move_and_delete(self):
+        photos = [MemoryPhoto.objects.create(category=self.category, image=make_image()) for _ in range(3)]
+        self.assert_counts(3, 0)
+
+        photos[0].category = self.other
+        photos[0].save()
+        self.assert_counts(2, 1)
+
+        photos[1].delete()
+        self.assert_counts(1, 1)
+
+    def test_admin_bulk_delete(self):
+        photos = [MemoryPhoto.objects.create(category=self.category, image=make_image()) for _ in range(3)]
+        MemoryPhoto.objects.create(category=self.other, image=make_image())
+
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.admin.post('/admin/api/memoryphoto/', {
+                'action': 'delete_selected',
+                '_selected_action': [photos[0].pk, photos[1].pk],
+                'post': 'yes',
+            })
+        self.assertEqual(response.status_code, 302)
+        self.assert_counts(1, 1)
+
+    def test_admin_bulk_delete_drops_dashboard_stats(self):
+        photo = MemoryPhoto.objects.create(category=self.category, image=make_image())
+        cache.set(DASHBOARD_STATS_CACHE_KEY, {'stale': True})
+        with self.captureOnCommitCallbacks(execute=True):
+            self.admin.post('/admin/api/memoryphoto/', {
+                'action': 'delete_selected', '_selected_action': [photo.pk], 'post': 'yes',
+            })
+        self.assertIsNone(cache.get(DASHBOARD_STATS_CACHE_KEY))
+
+    def test_refresh_photos_count(self):
+        MemoryPhoto.objects.create(category=self.category, image=make_image())
+        MemoryCategory.objects.update(photos_count=7)
+        MemoryCategory.objects.all().refresh_photos_count()
+        self.assert_counts(1, 0)
+
+    def test_admin_changelist_links_to_photos(self):
+        MemoryPhoto.objects.create(category=self.category, image=make_image())
+        response = self.admin.get('/admin/api/memorycategory/')
+        self.assertContains(response, f'/admin/api/memoryphoto/?category__id__exact={self.category.pk}')
+
+
+@override_settings(AUTH_TOKEN_CACHE_TIMEOUT=60)
+class CachedTokenAuthenticationTests(APITestCase):
+    """Cached token credentials are dropped when the user changes, but not on login bookkeeping"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {Token.objects.create(user=self.user).key}')
+
+    def test_deactivated_user_is_rejected(self):
+        self.assertEqual(self.client.get('/api/dashboard/stats/').status_code, 200)
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get('/api/dashboard/stats/').status_code, 401)
+
+    def test_last_login_update_skips_token_lookup(self):
+        with self.assertNumQueries(1):
+            self.user.save(update_fields=['last_login'])
+
+
+class TokenBucketThrottleTests(APITestCase):
+    """A bucket hands out exactly num_requests tokens, even to concurrent requests"""
+
+    def allow(self):
+        return LoginRateThrottle().allow_request(Request(APIRequestFactory().post('/api/auth/admin-login/')), None)
+
+    def test_bucket_runs_out(self):
+        self.assertEqual([self.allow() for _ in range(6)], [True] * 5 + [False])
+        throttle = LoginRateThrottle()
+        throttle.allow_request(Request(APIRequestFactory().post('/api/auth/admin-login/')), None)
+        self.assertTrue(0 < throttle.wait() <= 3600)
+
+    def test_concurrent_requests_share_the_tokens(self):
+        with ThreadPoolExecutor(max_workers=10) as pool:
+            results = list(pool.map(lambda _: self.allow(), range(20)))
+        self.assertEqual(results.count(True), 5)
+
+
+class AdminLoginThrottleTests(APITestCase):
+    """Failed logins blacklist the client; a blacklisted client no longer spends rate tokens"""
+
+    def login(self, password='wrong'):
+        return self.client.post('/api/auth/admin-login/', {'username': 'admin', 'password': password}, format='json')
+
+    def test_blacklist_after_failed_logins(self):
+        User.objects.create_superuser('admin', 'admin@example.com', 'password')
+        for _ in range(LOGIN_FAILURE_LIMIT):
+            self.assertEqual(self.login().status_code, 401)
+
+        # With a fresh rate bucket, the blacklist alone refuses the client and no token is spent
+        bucket_key = LoginRateThrottle().cache_format % {'scope': 'login', 'ident': '127.0.0.1'}
+        cache.delete(bucket_key)
+        self.assertEqual(self.login(password='password').status_code, 429)
+        self.assertIsNone(cache.get(bucket_key))
+
+
+class BulkUploadTests(APITestCase):
+    """bulk_upload stores every file, bumps the counter and releases its concurrency slot"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+
+    def test_bulk_upload(self):
+        category = MemoryCategory.objects.create(name='الرحلة')
+        response = self.client.post('/api/memory-photos/bulk_upload/', {
+            'category': category.pk,
+            'images': [make_image('a.png'), make_image('b.png')],
+            'metadata_1_is_featured': 'true',
+        }, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['created_count'], 2)
+
+        photos = MemoryPhoto.objects.filter(category=category).order_by('pk')
+        self.assertEqual([photo.is_featured for photo in photos], [False, True])
+        for photo in photos:
+            self.assertTrue(photo.image.name.endswith('.jpg'))
+            self.assertTrue(photo.image.storage.exists(photo.image.name))
+            self.assertTrue(photo.thumbnail.storage.exists(photo.thumbnail.name))
+            self.assertEqual(photo.file_size, photo.image.size + photo.thumbnail.size)
+        category.refresh_from_db()
+        self.assertEqual(category.photos_count, 2)
+
+        if connection.vendor == 'postgresql':  # limit_concurrency only takes a slot there
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT count(*) FROM pg_locks WHERE locktype = 'advisory' AND pid = pg_backend_pid()")
+                self.assertEqual(cursor.fetchone()[0], 0)
+
+    @skipUnless(connection.vendor == 'postgresql', 'upload slots are PostgreSQL advisory locks')
+    def test_busy_slots_refuse_the_upload(self):
+        category = MemoryCategory.objects.create(name='الرحلة')
+        user_id = User.objects.get(username='admin').pk
+        # Hold every slot from another session, as concurrent uploads in other workers would
+        other = connections.create_connection(DEFAULT_DB_ALIAS)
+        try:
+            with other.cursor() as cursor:
+                for slot_key in advisory_slot_keys('bulk_upload', BULK_UPLOAD_CONCURRENCY):
+                    cursor.execute('SELECT pg_advisory_lock(%s, %s)', [slot_key, user_id])
+            response = self.client.post('/api/memory-photos/bulk_upload/', {
+                'category': category.pk, 'images': [make_image()],
+            }, format='multipart')
+        finally:
+            other.close()
+        self.assertEqual(response.status_code, 429)
+        self.assertFalse(MemoryPhoto.objects.exists())
+
+    def test_failed_file_is_reported_without_failing_the_upload(self):
+        category = MemoryCategory.objects.create(name='الرحلة')
+        save = FileSystemStorage.save
+
+        def failing_save(storage, name, content, *args, **kwargs):
+            if 'bad' in name:
+                raise OSError('disk full')
+            return save(storage, name, content, *args, **kwargs)
+
+        with mock.patch.object(FileSystemStorage, 'save', failing_save):
+            response = self.client.post('/api/memory-photos/bulk_upload/', {
+                'category': category.pk,
+                'images': [make_image('good.png'), make_image('bad.png')],
+            }, format='multipart')
+        self.assertEqual(response.status_code, 201)
+        data = response.json()
+        self.assertEqual((data['created_count'], data['error_count']), (1, 1))
+        self.assertEqual(data['errors'][0]['image_index'], 1)
+        category.refresh_from_db()
+        self.assertEqual(category.photos_count, 1)
+
+    def test_failed_insert_removes_stored_files(self):
+        category = MemoryCategory.objects.create(name='الرحلة')
+
+        def delete_now(names):
+            for name in names:
+                if name:
+                    delete_file_if_exists(name)
+
+        with mock.patch.object(MemoryPhoto.objects, 'bulk_create', side_effect=DatabaseError('insert failed')), \
+                mock.patch('api.views.delete_files_if_exist', side_effect=delete_now) as delete_files:
+            response = self.client.post('/api/memory-photos/bulk_upload/', {
+                'category': category.pk, 'images': [make_image('a.png')],
+            }, format='multipart')
+        self.assertEqual(response.status_code, 500)
+        self.assertFalse(MemoryPhoto.objects.exists())
+        stored = delete_files.call_args.args[0]
+        self.assertEqual(len(stored), 2)
+        self.assertFalse(any(FileSystemStorage().exists(name) for name in stored))
+
+
+class ColleagueListETagTests(APITestCase):
+    """The colleague list answers a matching If-None-Match with 304 until a colleague changes"""
+
+    def setUp(self):
+        super().setUp()
+        self.colleague = Colleague.objects.create(name='أحمد')
+
+    def test_unchanged_list_is_not_modified(self):
+        response = self.client.get('/api/colleagues/')
+        self.assertEqual(response.status_code, 200)
+        etag = response['ETag']
+
+        with self.assertNumQueries(0):
+            response = self.client.get('/api/colleagues/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        # Another query string is another page, with its own tag
+        response = self.client.get('/api/colleagues/?status=active', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_clear_deceased_fields_action_changes_the_etag(self):
+        Colleague.objects.filter(pk=self.colleague.pk).update(death_year=1990)
+        etag = self.client.get('/api/colleagues/')['ETag']
+        admin = Client()
+        admin.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        with self.captureOnCommitCallbacks(execute=True):
+            admin.post('/admin/api/colleague/', {
+                'action': 'clear_deceased_fields', '_selected_action': [self.colleague.pk],
+            })
+        self.colleague.refresh_from_db()
+        self.assertIsNone(self.colleague.death_year)
+        response = self.client.get('/api/colleagues/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()['results'][0]['death_year'])
+
+    def test_writes_change_the_etag(self):
+        etag = self.client.get('/api/colleagues/')['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            self.colleague.name = 'أحمد علي'
+            self.colleague.save()
+        response = self.client.get('/api/colleagues/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+        etag = response['ETag']
+        with self.captureOnCommitCallbacks(execute=True):
+            ColleagueArchiveImage.objects.create(colleague=self.colleague, image=make_image())
+        self.assertEqual(self.client.get('/api/colleagues/', HTTP_IF_NONE_MATCH=etag).status_code, 200)
+
+
+class DashboardStatsETagTests(APITestCase):
+    """Dashboard polls get a 304 while the cached stats last, and fresh numbers after a change"""
+
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+
+    def test_not_modified_until_content_changes(self):
+        response = self.client.get('/api/dashboard/stats/')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('private', response['Cache-Control'])
+        etag = response['ETag']
+
+        self.assertEqual(self.client.get('/api/dashboard/stats/', HTTP_IF_NONE_MATCH=etag).status_code, 304)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            MemoryCategory.objects.create(name='الرحلة')
+        response = self.client.get('/api/dashboard/stats/', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response['ETag'], etag)
+
+
+class ColleagueStatusActionsTests(APITestCase):
+    """by_status, promoted and deceased return a bare list, or a page when one is asked for"""
+
+    def setUp(self):
+        super().setUp()
+        Colleague.objects.create(name='أحمد', status='promoted')
+        Colleague.objects.create(name='محمد', status='deceased')
+        self.expected = [
+            ('/api/colleagues/by_status/?status=promoted', ['أحمد']),
+            ('/api/colleagues/promoted/', ['أحمد']),
+            ('/api/colleagues/deceased/', ['محمد']),
+        ]
+
+    def test_bare_list_by_default(self):
+        for url, names in self.expected:
+            self.assertEqual([colleague['name'] for colleague in self.client.get(url).json()], names)
+        self.assertEqual(self.client.get('/api/colleagues/by_status/?status=unknown').json(), [])
+
+    def test_paginated_on_request(self):
+        for url, names in self.expected:
+            data = self.client.get(url + ('&' if '?' in url else '?') + 'page=1').json()
+            self.assertEqual(data['count'], len(names))
+            self.assertEqual([colleague['name'] for colleague in data['results']], names)
+        response = self.client.get('/api/colleagues/by_status/?status=unknown&page_size=10')
+        self.assertEqual(response.status_code, 400)
+
+class ORJSONRendererTests(SimpleTestCase):
+    """The orjson renderer matches DRF's JSONRenderer output, JS-unsafe separators included"""
+
+    def test_matches_json_renderer(self):
+        data = {'name': 'زميل\u2028سطر\u2029فقرة', 'count': 1, 'items': [None, True]}
+        self.assertEqual(ORJSONRenderer().render(data), JSONRenderer().render(data))
+        self.assertNotIn(b'\xe2\x80\xa8', ORJSONRenderer().render(data))
+
+
+class WindowCountPaginationTests(APITestCase):
+    """A page and its total come from one query; edge cases fall back to the stock paginator"""
+
+    def setUp(self):
+        super().setUp()
+        for name in ['أ', 'ب', 'ت', 'ث', 'ج']:
+            Colleague.objects.create(name=name)
+        self.queryset = Colleague.objects.order_by('pk')
+
+    def paginate(self, queryset, **params):
+        paginator = StandardResultsSetPagination()
+        request = Request(APIRequestFactory().get('/api/colleagues/', params))
+        return paginator, paginator.paginate_queryset(queryset, request)
+
+    def test_page_and_count_in_one_query(self):
+        with self.assertNumQueries(1):
+            paginator, rows = self.paginate(self.queryset, page=2, page_size=2)
+            data = paginator.get_paginated_response([row.pk for row in rows]).data
+        self.assertEqual(data['count'], 5)
+        self.assertEqual(data['results'], list(self.queryset.values_list('pk', flat=True)[2:4]))
+        self.assertIn('page=3', data['next'])
+        self.assertEqual(data['previous'], 'http://testserver/api/colleagues/?page_size=2')
+
+    def test_values_rows_drop_the_count_annotation(self):
+        paginator, rows = self.paginate(self.queryset.values('name'), page_size=2)
+        self.assertEqual(rows, [{'name': 'أ'}, {'name': 'ب'}])
+        self.assertEqual(paginator.page.paginator.count, 5)
+
+    def test_last_and_out_of_range_pages(self):
+        paginator, rows = self.paginate(self.queryset, page='last', page_size=2)
+        self.assertEqual([row.name for row in rows], ['ج'])
+        with self.assertRaises(NotFound):
+            self.paginate(self.queryset, page=4, page_size=2)
+
+
+class ProcessImageTests(SimpleTestCase):
+    """process_image returns the resized JPEG and its thumbnail from one decode"""
+
+    def test_sizes_and_names(self):
+        buffer = io.BytesIO()
+        Image.new('RGBA', (4000, 3000), (59, 130, 246, 128)).save(buffer, format='PNG')
+        optimized, thumbnail = process_image(SimpleUploadedFile('trip.png', buffer.getvalue()))
+        self.assertEqual((optimized.name, thumbnail.name), ('trip.jpg', 'trip_thumb.jpg'))
+        self.assertEqual(Image.open(optimized).size, (1920, 1440))
+        self.assertEqual(Image.open(thumbnail).size, (400, 300))
+        self.assertEqual(optimized.size, len(optimized.file.getvalue()))
+
+    def test_undecodable_upload(self):
+        with self.assertLogs('api.utils.image_processing', 'ERROR'):
+            result = process_image(SimpleUploadedFile('notes.png', b'not an image'))
+        self.assertEqual(result, (None, None))
+
+
+
+class DataMigrationTests(APITestCase):
+    """
+    The backfills of migrations 0031 and 0033, run against tables built from the models
+    (the migration history itself doesn't replay on an empty database, see test_settings)
+    """
+
+    def run_backfill(self, migration_name, function_name):
+        getattr(import_module(f'api.migrations.{migration_name}'), function_name)(django_apps, None)
+
+    def test_0031_backfills_photos_count(self):
+        memory = MemoryCategory.objects.create(name='الرحلة')
+        meeting = MeetingCategory.objects.create(name='اللقاء')
+        empty = MemoryCategory.objects.create(name='أخرى')
+        for _ in range(2):
+            MemoryPhoto.objects.create(category=memory, image=make_image())
+        MeetingPhoto.objects.create(category=meeting, image=make_image())
+        MemoryCategory.objects.update(photos_count=9)
+        MeetingCategory.objects.update(photos_count=0)
+
+        self.run_backfill('0031_category_photos_count', 'backfill_photos_count')
+
+        counts = {category.pk: category.photos_count for category in MemoryCategory.objects.all()}
+        self.assertEqual(counts, {memory.pk: 2, empty.pk: 0})
+        self.assertEqual(MeetingCategory.objects.get().photos_count, 1)
+
+    def test_0033_backfills_file_size_from_storage(self):
+        category = MemoryCategory.objects.create(name='الرحلة')
+        photo = MemoryPhoto.objects.create(category=category, image=make_image())
+        missing = MemoryPhoto.objects.create(category=category, image=make_image())
+        colleague = Colleague.objects.create(name='أحمد', photo=make_image())
+        missing.image.storage.delete(missing.image.name)
+        MemoryPhoto.objects.update(file_size=0)
+        Colleague.objects.update(file_size=0)
+
+        self.run_backfill('0033_file_size', 'backfill_file_size')
+
+        photo.refresh_from_db()
+        missing.refresh_from_db()
+        colleague.refresh_from_db()
+        self.assertEqual(photo.file_size, photo.image.size)
+        self.assertEqual(missing.file_size, 0)
+        self.assertEqual(colleague.file_size, colleague.photo.size)
+
+
+class CategoryAdminChangelistTests(APITestCase):
+    """The category changelists read the stored photo counts: no query per category row"""
+
+    def setUp(self):
+        super().setUp()
+        self.admin = Client()
+        self.admin.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+
+    def changelist_queries(self, url):
+        with CaptureQueriesContext(connection) as queries:
+            self.assertEqual(self.admin.get(url).status_code, 200)
+        return len(queries)
+
+    def test_query_count_does_not_grow_with_categories(self):
+        for url, category_model, photo_model in [
+            ('/admin/api/memorycategory/', MemoryCategory, MemoryPhoto),
+            ('/admin/api/meetingcategory/', MeetingCategory, MeetingPhoto),
+        ]:
+            category = category_model.objects.create(name='الأولى')
+            photo_model.objects.create(category=category, image=make_image())
+            baseline = self.changelist_queries(url)
+            for name in ['الثانية', 'الثالثة', 'الرابعة']:
+                photo_model.objects.create(category=category_model.objects.create(name=name), image=make_image())
+            self.assertEqual(self.changelist_queries(url), baseline)
+
+
+class AdminRawDeleteTests(APITestCase):
+    """Admin bulk deletes remove rows with raw DELETEs and unlink their files after commit"""
+
+    def setUp(self):
+        super().setUp()
+        self.admin = Client()
+        self.admin.force_login(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+
+    def delete_selected(self, url, pks):
+        # Unlink files synchronously instead of in the background pool, so the test can see them go
+        def delete_now(names):
+            for name in names:
+                if name:
+                    delete_file_if_exists(name)
+
+        with mock.patch('api.admin.delete_files_if_exist', side_effect=delete_now), \
+                self.captureOnCommitCallbacks(execute=True):
+            response = self.admin.post(url, {'action': 'delete_selected', '_selected_action': pks, 'post': 'yes'})
+        self.assertEqual(response.status_code, 302)
+
+    def assert_files_gone(self, *field_files):
+        for field_file in field_files:
+            self.assertFalse(field_file.storage.exists(field_file.name), field_file.name)
+
+    def test_category_delete_removes_photos_and_files(self):
+        category = MemoryCategory.objects.create(name='الرحلة')
+        kept = MemoryCategory.objects.create(name='أخرى')
+        photos = [MemoryPhoto.objects.create(category=category, image=make_image()) for _ in range(2)]
+        kept_photo = MemoryPhoto.objects.create(category=kept, image=make_image())
+
+        self.delete_selected('/admin/api/memorycategory/', [category.pk])
+
+        self.assertEqual(list(MemoryCategory.objects.all()), [kept])
+        self.assertEqual(list(MemoryPhoto.objects.all()), [kept_photo])
+        self.assert_files_gone(*(photo.image for photo in photos))
+        self.assertTrue(kept_photo.image.storage.exists(kept_photo.image.name))
+        kept.refresh_from_db()
+        self.assertEqual(kept.photos_count, 1)
+
+    def test_colleague_delete_cascades_archive_images(self):
+        colleague = Colleague.objects.create(name='أحمد', photo=make_image())
+        other = Colleague.objects.create(name='محمد')
+        archive = [ColleagueArchiveImage.objects.create(colleague=colleague, image=make_image()) for _ in range(2)]
+        other_archive = ColleagueArchiveImage.objects.create(colleague=other, image=make_image())
+
+        self.delete_selected('/admin/api/colleague/', [colleague.pk])
+
+        self.assertEqual(list(Colleague.objects.all()), [other])
+        self.assertEqual(list(ColleagueArchiveImage.objects.all()), [other_archive])
+        self.assert_files_gone(colleague.photo, *(image.image for image in archive))
+
+    def test_archive_image_delete(self):
+        colleague = Colleague.objects.create(name='أحمد')
+        images = [ColleagueArchiveImage.objects.create(colleague=colleague, image=make_image()) for _ in range(3)]
+
+        self.delete_selected('/admin/api/colleaguearchiveimage/', [images[0].pk, images[1].pk])
+
+        self.assertEqual(list(ColleagueArchiveImage.objects.all()), [images[2]])
+        self.assert_files_gone(images[0].image, images[1].image)
+
+
+class IndexMigrationTests(APITestCase):
+    """The declared indexes compile on PostgreSQL and the migrations keep up with the models"""
+
+    def test_model_indexes_exist(self):
+        with connection.cursor() as cursor:
+            for model in django_apps.get_app_config('api').get_models():
+                constraints = connection.introspection.get_constraints(cursor, model._meta.db_table)
+                for index in model._meta.indexes:
+                    self.assertIn(index.name, constraints, model.__name__)
+
+    @override_settings(MIGRATION_MODULES={})
+    def test_migrations_match_models(self):
+        # Loads the real migration history (test_settings disables it for the database)
+        call_command('makemigrations', 'api', check=True, dry_run=True, verbosity=0)
+
+
+class ImageValidatorTests(SimpleTestCase):
+    """Uploads are identified by their magic numbers and checked for size and dimensions"""
+
+    def upload(self, fmt, size=(8, 8), name='photo', mode='RGB'):
+        buffer = io.BytesIO()
+        Image.new(mode, size).save(buffer, format=fmt)
+        return SimpleUploadedFile(f'{name}.{fmt.lower()}', buffer.getvalue())
+
+    def test_allowed_formats(self):
+        for fmt, mime in [('JPEG', 'image/jpeg'), ('PNG', 'image/png'), ('GIF', 'image/gif'), ('WEBP', 'image/webp')]:
+            upload = self.upload(fmt)
+            self.assertEqual(sniff_image_type(upload.read(12)), mime)
+            validate_uploaded_image(upload)
+            self.assertEqual(upload.tell(), 0)
+
+    def test_gif87a_signature(self):
+        self.assertEqual(sniff_image_type(b'GIF87a' + bytes(6)), 'image/gif')
+
+    def test_rejected_content(self):
+        for upload in [
+            self.upload('BMP'),
+            SimpleUploadedFile('notes.png', b'not an image at all'),
+            SimpleUploadedFile('riff.webp', b'RIFF\x00\x00\x00\x00WAVE'),
+        ]:
+            with self.assertRaises(ValidationError, msg=upload.name):
+                validate_uploaded_image(upload)
+
+    def test_oversized_dimensions(self):
+        with self.assertRaisesMessage(ValidationError, '10001x1'):
+            validate_uploaded_image(self.upload('PNG', size=(10001, 1), mode='L'))
+
+    def test_oversized_file(self):
+        upload = self.upload('PNG')
+        upload.size = 100 * 1024 * 1024 + 1
+        with self.assertRaisesMessage(ValidationError, '100MB'):
+            validate_uploaded_image(upload)
+
+    def test_find_invalid_upload_reports_the_first_in_upload_order(self):
+        uploads = [self.upload('PNG'), SimpleUploadedFile('a.png', b'x'), SimpleUploadedFile('b.png', b'y')]
+        index, upload, error = find_invalid_upload(uploads)
+        self.assertEqual((index, upload.name), (1, 'a.png'))
+        self.assertIsInstance(error, ValidationError)
+        self.assertIsNone(find_invalid_upload([self.upload('JPEG'), self.upload('GIF')]))
+
+
+class FileSizeTests(APITestCase):
+    """file_size holds the combined size of an instance's stored files"""
+
+    def test_sums_the_file_fields(self):
+        colleague = Colleague.objects.create(name='أحمد', photo=make_image(), latest_photo=make_image())
+        self.assertEqual(colleague.file_size, colleague.photo.size + colleague.latest_photo.size)
+        self.assertEqual(Colleague.objects.get().file_size, colleague.file_size)
+
+        colleague.latest_photo = None
+        colleague.save()
+        self.assertEqual(Colleague.objects.get().file_size, colleague.photo.size)
+
+    def test_missing_file_counts_as_empty(self):
+        category = MemoryCategory.objects.create(name='الرحلة')
+        photo = MemoryPhoto.objects.create(category=category, image=make_image())
+        photo.image.storage.delete(photo.image.name)
+        photo.description_ar = 'وصف'
+        photo.save()
+        self.assertEqual(MemoryPhoto.objects.get().file_size, 0)
+
+    def test_dashboard_sums_stored_sizes(self):
+        category = MemoryCategory.objects.create(name='الرحلة')
+        MemoryPhoto.objects.create(category=category, image=make_image())
+        Colleague.objects.create(name='أحمد', photo=make_image())
+        MemoryPhoto.objects.update(file_size=3 * 1024 ** 2)
+        Colleague.objects.update(file_size=2 * 1024 ** 2)
+        self.client.force_authenticate(User.objects.create_superuser('admin', 'admin@example.com', 'password'))
+        self.assertEqual(self.client.get('/api/dashboard/stats/').json()['storage']['media_size_mb'], 5.0)
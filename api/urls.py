@@ -3,6 +3,9 @@ from rest_framework.routers import DefaultRouter
 from . import views
 
 router = DefaultRouter()
+# Renderers are picked from the Accept header; skipping the optional .json/.api suffix
+# variants halves the patterns the resolver walks on every request
+router.include_format_suffixes = False
 router.register(r'memory-categories', views.MemoryCategoryViewSet)
 router.register(r'memory-photos', views.MemoryPhotoViewSet)
 router.register(r'meeting-categories', views.MeetingCategoryViewSet)
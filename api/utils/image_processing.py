@@ -5,9 +5,75 @@ from PIL import Image
 from io import BytesIO
 from django.core.files.uploadedfile import InMemoryUploadedFile
 from django.core.files.base import ContentFile
-import sys
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
+
+def open_image(image_field):
+    """
+    Open an uploaded file, a saved ImageField or a path with PIL (header only, no decode)
+    
+    Returns:
+        tuple: (PIL image, original file name)
+    """
+    if hasattr(image_field, 'read'):
+        # It's a file-like object (InMemoryUploadedFile, etc.)
+        image_field.seek(0)  # Reset file pointer
+        img = Image.open(image_field)
+        original_name = image_field.name if hasattr(image_field, 'name') else 'image.jpg'
+    elif hasattr(image_field, 'path'):
+        # It's a Django ImageField with a path (already saved)
+        img = Image.open(image_field.path)
+        original_name = os.path.basename(image_field.name)
+    else:
+        # Try to open it directly
+        img = Image.open(image_field)
+        original_name = getattr(image_field, 'name', 'image.jpg')
+    return img, original_name
+
+
+def convert_to_rgb(img):
+    """Convert to RGB for JPEG output, flattening transparency onto a white background"""
+    if img.mode in ('RGBA', 'LA', 'P'):
+        # Create a white background
+        background = Image.new('RGB', img.size, (255, 255, 255))
+        if img.mode == 'P':
+            img = img.convert('RGBA')
+        background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
+        return background
+    if img.mode != 'RGB':
+        return img.convert('RGB')
+    return img
+
+
+def encode_jpeg(img, file_name, quality):
+    """Encode a PIL image as JPEG into an InMemoryUploadedFile ready to be saved"""
+    img_io = BytesIO()
+    img.save(img_io, format='JPEG', quality=quality, optimize=True)
+    img_io.seek(0)
+    return InMemoryUploadedFile(
+        img_io,
+        None,
+        file_name,
+        'image/jpeg',
+        img_io.getbuffer().nbytes,
+        None
+    )
+
+
+def thumbnail_name(original_name):
+    """Thumbnail file name derived from the original file name"""
+    name, ext = os.path.splitext(os.path.basename(original_name))
+    return f"{name}_thumb{ext if ext else '.jpg'}"
+
+
+def jpeg_name(original_name, suffix=''):
+    """File name for a JPEG re-encoding of original_name, e.g. trip.png -> trip_thumb.jpg"""
+    name = os.path.splitext(os.path.basename(original_name))[0]
+    return f"{name}{suffix}.jpg"
+
 
 def generate_thumbnail(image_field, max_size=(400, 400), quality=85):
     """
@@ -25,60 +91,21 @@ def generate_thumbnail(image_field, max_size=(400, 400), quality=85):
         return None
     
     try:
-        # Open the original image - handle file objects properly
-        if hasattr(image_field, 'read'):
-            # It's a file-like object (InMemoryUploadedFile, etc.)
-            image_field.seek(0)  # Reset file pointer
-            img = Image.open(image_field)
-            original_name = image_field.name if hasattr(image_field, 'name') else 'image.jpg'
-        elif hasattr(image_field, 'path'):
-            # It's a Django ImageField with a path (already saved)
-            img = Image.open(image_field.path)
-            original_name = os.path.basename(image_field.name)
-        else:
-            # Try to open it directly
-            img = Image.open(image_field)
-            original_name = getattr(image_field, 'name', 'image.jpg')
+        img, original_name = open_image(image_field)
         
-        # Convert RGBA to RGB if necessary (for JPEG compatibility)
-        if img.mode in ('RGBA', 'LA', 'P'):
-            # Create a white background
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
+        # Shrink-on-load: let libjpeg decode at 1/2, 1/4 or 1/8 scale before any pixel access.
+        # The mode conversion below loads the image, so this must come first (no-op for non-JPEG).
+        # Decode to at least twice the thumbnail size so LANCZOS still has detail to resample from
+        img.draft('RGB', (max_size[0] * 2, max_size[1] * 2))
+        img = convert_to_rgb(img)
         
         # Calculate thumbnail size maintaining aspect ratio
         img.thumbnail(max_size, Image.Resampling.LANCZOS)
         
-        # Create a BytesIO buffer
-        thumb_io = BytesIO()
-        
-        # Save thumbnail to buffer
-        img.save(thumb_io, format='JPEG', quality=quality, optimize=True)
-        thumb_io.seek(0)
-        
-        # Get the original filename and create thumbnail filename
-        name, ext = os.path.splitext(os.path.basename(original_name))
-        thumb_filename = f"{name}_thumb{ext if ext else '.jpg'}"
-        
-        # Create InMemoryUploadedFile
-        thumbnail = InMemoryUploadedFile(
-            thumb_io,
-            None,
-            thumb_filename,
-            'image/jpeg',
-            sys.getsizeof(thumb_io),
-            None
-        )
-        
-        return thumbnail
+        return encode_jpeg(img, thumbnail_name(original_name), quality)
         
-    except Exception as e:
-        print(f"Error generating thumbnail: {str(e)}")
+    except Exception:
+        logger.exception("Error generating thumbnail")
         return None
 
 
@@ -98,71 +125,57 @@ def optimize_image(image_field, max_dimension=1920, quality=85):
         return None
     
     try:
-        # Open the original image - handle file objects properly
-        if hasattr(image_field, 'read'):
-            # It's a file-like object (InMemoryUploadedFile, etc.)
-            image_field.seek(0)  # Reset file pointer
-            img = Image.open(image_field)
-            original_name = image_field.name if hasattr(image_field, 'name') else 'image.jpg'
-        elif hasattr(image_field, 'path'):
-            # It's a Django ImageField with a path (already saved)
-            img = Image.open(image_field.path)
-            original_name = os.path.basename(image_field.name)
-        else:
-            # Try to open it directly
-            img = Image.open(image_field)
-            original_name = getattr(image_field, 'name', 'image.jpg')
+        img, original_name = open_image(image_field)
         
-        original_format = img.format
+        # Shrink-on-load: libjpeg decodes only the DCT scale needed for max_dimension
+        # (1/2, 1/4 or 1/8) instead of the full pixel grid; must run before any pixel access
+        img.draft('RGB', (max_dimension, max_dimension))
+        img = convert_to_rgb(img)
         
-        # Convert RGBA to RGB if necessary
-        if img.mode in ('RGBA', 'LA', 'P'):
-            background = Image.new('RGB', img.size, (255, 255, 255))
-            if img.mode == 'P':
-                img = img.convert('RGBA')
-            background.paste(img, mask=img.split()[-1] if img.mode == 'RGBA' else None)
-            img = background
-        elif img.mode != 'RGB':
-            img = img.convert('RGB')
+        # Resize in place if image is larger than max_dimension (maintains aspect ratio, never upscales).
+        # After draft() at most a ~2x reduction is left, so BILINEAR matches LANCZOS from full size
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.BILINEAR)
         
-        # Resize if image is larger than max_dimension
-        width, height = img.size
-        if width > max_dimension or height > max_dimension:
-            if width > height:
-                new_width = max_dimension
-                new_height = int(height * (max_dimension / width))
-            else:
-                new_height = max_dimension
-                new_width = int(width * (max_dimension / height))
-            
-            img = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        return encode_jpeg(img, os.path.basename(original_name), quality)
         
-        # Create a BytesIO buffer
-        img_io = BytesIO()
-        
-        # Determine format
-        save_format = 'JPEG' if original_format in ('JPEG', 'JPG') else 'JPEG'
-        
-        # Save optimized image
-        img.save(img_io, format=save_format, quality=quality, optimize=True)
-        img_io.seek(0)
+    except Exception:
+        logger.exception("Error optimizing image")
+        return None
+
+
+def process_image(image_field, max_dimension=1920, thumbnail_size=(400, 400), quality=85):
+    """
+    Produce the optimized image and its thumbnail from a single decode; both are JPEGs
+    Use this instead of optimize_image() + generate_thumbnail() when both are needed (bulk_upload does)
+    
+    Args:
+        image_field: Django ImageField instance
+        max_dimension: Maximum width or height of the optimized image
+        thumbnail_size: Tuple of (width, height) for maximum thumbnail size
+        quality: JPEG quality (1-100)
+    
+    Returns:
+        tuple: (optimized InMemoryUploadedFile, thumbnail InMemoryUploadedFile),
+        or (None, None) if processing fails
+    """
+    if not image_field:
+        return None, None
+    
+    try:
+        img, original_name = open_image(image_field)
         
-        # Get original filename
-        original_name = os.path.basename(original_name)
+        # Decode once, at the smallest DCT scale that still covers max_dimension
+        img.draft('RGB', (max_dimension, max_dimension))
+        img = convert_to_rgb(img)
+        img.thumbnail((max_dimension, max_dimension), Image.Resampling.BILINEAR)
+        optimized = encode_jpeg(img, jpeg_name(original_name), quality)
         
-        # Create InMemoryUploadedFile
-        optimized_image = InMemoryUploadedFile(
-            img_io,
-            None,
-            original_name,
-            f'image/{save_format.lower()}',
-            sys.getsizeof(img_io),
-            None
-        )
+        # The thumbnail is scaled down from the already reduced raster, not from the source
+        img.thumbnail(thumbnail_size, Image.Resampling.LANCZOS)
+        thumbnail = encode_jpeg(img, jpeg_name(original_name, '_thumb'), quality)
         
-        return optimized_image
+        return optimized, thumbnail
         
-    except Exception as e:
-        print(f"Error optimizing image: {str(e)}")
-        return None
-
+    except Exception:
+        logger.exception("Error processing image")
+        return None, None
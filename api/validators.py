@@ -3,14 +3,31 @@ Custom validators for API models and views
 """
 from django.core.exceptions import ValidationError
 from django.core.validators import FileExtensionValidator
+from concurrent.futures import ThreadPoolExecutor
+from io import BytesIO
 from PIL import Image
 
-# Optional import for python-magic (requires system library on Windows)
-try:
-    import magic
-    HAS_MAGIC = True
-except (ImportError, OSError):
-    HAS_MAGIC = False
+# Magic numbers of the allowed image types: all (offset, signature) pairs must match.
+# The first 12 bytes identify every allowed format, so no libmagic lookup is needed
+IMAGE_SIGNATURES = [
+    (((0, b'\xff\xd8\xff'),), 'image/jpeg'),
+    (((0, b'\x89PNG\r\n\x1a\n'),), 'image/png'),
+    (((0, b'GIF87a'),), 'image/gif'),
+    (((0, b'GIF89a'),), 'image/gif'),
+    (((0, b'RIFF'), (8, b'WEBP')), 'image/webp'),
+]
+
+# Bytes read once per upload for MIME sniffing and dimensions; covers the JPEG
+# EXIF/APP segments that precede the frame header in camera photos
+IMAGE_HEADER_BYTES = 64 * 1024
+
+
+def read_image_header(file):
+    """Read the first IMAGE_HEADER_BYTES of an upload, leaving the file position at 0"""
+    file.seek(0)
+    header = file.read(IMAGE_HEADER_BYTES)
+    file.seek(0)
+    return header
 
 
 def validate_image_size(image):
@@ -25,16 +42,24 @@ def validate_image_size(image):
         )
 
 
-def validate_image_dimensions(image):
+def validate_image_dimensions(image, header=None):
     """
     Validate image dimensions to prevent memory exhaustion
     Maximum dimensions: 10000x10000 pixels
+    Only the header is parsed (no pixel decode); pass header to reuse an earlier read
     """
     max_width = 10000
     max_height = 10000
     
     try:
-        img = Image.open(image)
+        img = None
+        if header is not None:
+            try:
+                img = Image.open(BytesIO(header))
+            except Exception:
+                img = None  # Frame header lies beyond the buffer - parse the file itself
+        if img is None:
+            img = Image.open(image)
         width, height = img.size
         
         if width > max_width or height > max_height:
@@ -46,45 +71,29 @@ def validate_image_dimensions(image):
         raise ValidationError(f'Invalid image file: {str(e)}')
 
 
-def validate_image_content_type(file):
+def sniff_image_type(header):
+    """Return the MIME type of an allowed image format from its leading bytes, or None"""
+    for parts, mime in IMAGE_SIGNATURES:
+        if all(header[offset:offset + len(signature)] == signature for offset, signature in parts):
+            return mime
+    return None
+
+
+def validate_image_content_type(file, header=None):
     """
-    Validate that the file is actually an image by checking its MIME type
-    Uses python-magic for robust detection (if available)
+    Validate that the file is actually an image by checking its magic number
+    Only the first 12 bytes are needed; pass header to reuse an earlier read
     """
-    allowed_types = [
-        'image/jpeg',
-        'image/jpg',
-        'image/png',
-        'image/gif',
-        'image/webp'
-    ]
+    if header is None:
+        file.seek(0)
+        header = file.read(12)
+        file.seek(0)
     
-    # Use python-magic if available (Linux/production)
-    if HAS_MAGIC:
-        try:
-            # Read first 2048 bytes for magic detection
-            file.seek(0)
-            file_header = file.read(2048)
-            file.seek(0)
-            
-            # Detect MIME type
-            mime = magic.from_buffer(file_header, mime=True)
-            
-            if mime not in allowed_types:
-                raise ValidationError(
-                    f'Invalid image type: {mime}. Allowed types: {", ".join(allowed_types)}'
-                )
-            return
-        except Exception:
-            pass  # Fall through to extension check
-    
-    # Fallback validation using file extension (works on all platforms)
-    if not hasattr(file, 'name'):
-        raise ValidationError('Invalid file upload')
-    
-    ext = file.name.split('.')[-1].lower()
-    if ext not in ['jpg', 'jpeg', 'png', 'gif', 'webp']:
-        raise ValidationError(f'Invalid file extension: .{ext}')
+    if sniff_image_type(header) is None:
+        allowed_types = sorted({mime for _, mime in IMAGE_SIGNATURES})
+        raise ValidationError(
+            f'Invalid image type. Allowed types: {", ".join(allowed_types)}'
+        )
 
 
 # Composite validator for images
@@ -92,10 +101,34 @@ def validate_uploaded_image(image):
     """
     Combined validator for uploaded images
     Checks: size, dimensions, and content type
+    The header is read once and shared by the dimension and MIME checks
     """
     validate_image_size(image)
-    validate_image_dimensions(image)
-    validate_image_content_type(image)
+    header = read_image_header(image)
+    validate_image_dimensions(image, header)
+    validate_image_content_type(image, header)
+
+
+# Shared by all requests so bulk uploads don't start a pool of threads each time
+upload_validation_executor = ThreadPoolExecutor(max_workers=8, thread_name_prefix='upload-validation')
+
+def find_invalid_upload(images):
+    """
+    Validate a batch of uploads concurrently (file reads and Pillow parsing release the GIL).
+    Returns (index, image, error) of the first invalid upload in upload order, or None
+    """
+    def check(image):
+        try:
+            validate_uploaded_image(image)
+        except Exception as e:
+            return e
+        return None
+
+    errors = upload_validation_executor.map(check, images)
+    for index, (image, error) in enumerate(zip(images, errors)):
+        if error is not None:
+            return index, image, error
+    return None
 
 
 # Extension validator (used in model fields)
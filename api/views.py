@@ -5,52 +5,290 @@ from rest_framework import status
 from rest_framework.viewsets import ModelViewSet
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.decorators import action
-from rest_framework.pagination import PageNumberPagination
-from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
+from rest_framework.pagination import PageNumberPagination, CursorPagination
+from rest_framework.throttling import AnonRateThrottle, BaseThrottle, UserRateThrottle
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import SearchFilter, OrderingFilter
-from django.db.models import Count, Prefetch
+from django.db.models import Count, Max, Prefetch, Q, Sum, Window
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.functional import cached_property
+from django.core.paginator import Page, Paginator
+from django.core.cache import cache
 from django.utils import timezone
 from rest_framework.exceptions import ValidationError as DRFValidationError
-from .models import MemoryCategory, MemoryPhoto, MeetingCategory, MeetingPhoto, MeetingVideo, Colleague, ColleagueArchiveImage
+from .models import (
+    MemoryCategory, MemoryPhoto, MeetingCategory, MeetingPhoto, MeetingVideo, Colleague, ColleagueArchiveImage,
+    COLLEAGUES_VERSION_CACHE_KEY, DASHBOARD_STATS_CACHE_KEY, adjust_photos_count, delete_files_if_exist
+)
 from .serializers import (
-    MemoryCategorySerializer, MemoryPhotoSerializer, MemoryCategoryDetailSerializer,
-    MeetingCategorySerializer, MeetingPhotoSerializer, MeetingCategoryDetailSerializer, MeetingVideoSerializer,
+    MemoryCategorySerializer, MemoryPhotoSerializer, MemoryCategoryDetailSerializer, MemoryCategoryWithPhotosSerializer,
+    MeetingCategorySerializer, MeetingPhotoSerializer, MeetingCategoryDetailSerializer, MeetingCategoryWithPhotosSerializer,
+    MeetingVideoSerializer,
     ColleagueSerializer, ColleagueArchiveImageSerializer
 )
-from .validators import validate_uploaded_image
+from .renderers import ORJSONRenderer
+from .validators import find_invalid_upload, validate_uploaded_image
+from .utils.image_processing import process_image
 from django.contrib.auth import authenticate
 from django.contrib.auth.models import User
 from rest_framework.authtoken.models import Token
-from django.db import transaction
-from django.http import HttpResponse
+from django.db import connection, transaction
+from django.http import HttpResponse, StreamingHttpResponse
 import os
 import logging
 import io
+import hashlib
+import re
+import zlib
+import shutil
+import time
+from functools import lru_cache, wraps
 
 logger = logging.getLogger(__name__)
 
+# Dashboard numbers change slowly; serve them from cache for up to a minute
+DASHBOARD_STATS_CACHE_TIMEOUT = 60
+
+# Lifetime of the colleague list version; bounds how long another worker's cache keeps an old one
+COLLEAGUES_VERSION_CACHE_TIMEOUT = 60
+
+# with_photos payloads are keyed by their ETag, so a new version never reads an old entry
+WITH_PHOTOS_CACHE_TIMEOUT = 300
+WITH_PHOTOS_CHUNK_SIZE = 50
+
+# bulk_upload form keys carrying per-file metadata, e.g. metadata_0_is_featured
+METADATA_KEY_RE = re.compile(r'metadata_(\d+)_(.+)')
+
+# Bulk uploads one user may run at the same time, across all workers (PostgreSQL only)
+BULK_UPLOAD_CONCURRENCY = 2
+
+# Failed admin logins allowed per client before it is blacklisted, and for how long
+LOGIN_FAILURE_LIMIT = 5
+LOGIN_BLACKLIST_TIMEOUT = 3600
+
 # Custom throttle classes
-class LoginRateThrottle(AnonRateThrottle):
+class TokenBucketThrottleMixin:
+    """
+    Bucket version of SimpleRateThrottle.allow_request. Each client gets an integer bucket of
+    `num_requests` tokens in the cache that refills in full when it expires, `duration` after
+    it was opened. cache.add() opens it and cache.decr() takes a token, both atomic in Redis
+    and LocMem, so concurrent requests can't all spend the same token. Workers share the
+    buckets when REDIS_URL is set.
+    """
+    cache_format = 'throttle_bucket_%(scope)s_%(ident)s'
+
+    def allow_request(self, request, view):
+        if self.rate is None:
+            return True
+
+        self.key = self.get_cache_key(request, view)
+        if self.key is None:
+            return True
+
+        now = self.timer()
+        # The refill time only feeds Retry-After; it is written once per bucket
+        self.cache.add(self.key + ':reset', now + self.duration, self.duration)
+        self.cache.add(self.key, self.num_requests, self.duration)
+        try:
+            tokens_left = self.cache.decr(self.key)
+        except ValueError:
+            # The bucket expired between add() and decr(): this request opens a new one
+            self.cache.set(self.key, self.num_requests - 1, self.duration)
+            tokens_left = self.num_requests - 1
+        if tokens_left >= 0:
+            return True
+
+        self.wait_seconds = max(0, self.cache.get(self.key + ':reset', now + self.duration) - now)
+        return False
+
+    def wait(self):
+        return getattr(self, 'wait_seconds', None)
+
+class LoginRateThrottle(TokenBucketThrottleMixin, AnonRateThrottle):
     """Strict rate limiting for login attempts to prevent brute force attacks"""
     rate = '5/hour'
     scope = 'login'
 
-class UploadRateThrottle(UserRateThrottle):
+    def allow_request(self, request, view):
+        # LoginBlacklistThrottle already refuses blacklisted clients; don't spend their tokens too
+        if LoginBlacklistThrottle().is_blacklisted(request):
+            return True
+        return super().allow_request(request, view)
+
+class LoginBlacklistThrottle(BaseThrottle):
+    """
+    Reject clients blacklisted after repeated failed logins before authenticate()
+    runs the password hasher. Only a SHA-256 of the client address is stored.
+    """
+    def allow_request(self, request, view):
+        return not self.is_blacklisted(request)
+
+    def is_blacklisted(self, request):
+        return bool(cache.get('bl:' + login_client_digest(self.get_ident(request))))
+
+    def wait(self):
+        return LOGIN_BLACKLIST_TIMEOUT
+
+def login_client_digest(ident):
+    return hashlib.sha256(ident.encode()).hexdigest()
+
+def record_login_failure(request):
+    """Count a failed login for the client and blacklist it once the limit is reached"""
+    digest = login_client_digest(LoginBlacklistThrottle().get_ident(request))
+    failures_key = 'login:fail:' + digest
+    cache.add(failures_key, 0, timeout=LOGIN_BLACKLIST_TIMEOUT)
+    try:
+        failures = cache.incr(failures_key)
+    except ValueError:
+        # The counter expired between add() and incr()
+        failures = 1
+        cache.set(failures_key, failures, timeout=LOGIN_BLACKLIST_TIMEOUT)
+    if failures >= LOGIN_FAILURE_LIMIT:
+        cache.set('bl:' + digest, 1, timeout=LOGIN_BLACKLIST_TIMEOUT)
+        logger.warning(f"Blacklisted {request.META.get('REMOTE_ADDR')} after {failures} failed login attempts")
+
+class UploadRateThrottle(TokenBucketThrottleMixin, UserRateThrottle):
     """Rate limiting for file uploads"""
     rate = '100/hour'
     scope = 'upload'
 
+def advisory_slot_keys(scope, limit):
+    """First advisory lock key of each of the `limit` slots of a scope (the user id is the second)"""
+    return [zlib.crc32(f'{scope}:{slot}'.encode()) & 0x7fffffff for slot in range(limit)]
+
+def limit_concurrency(scope, limit):
+    """
+    Let each user run at most `limit` requests of a view at once, across all workers.
+    Slots are PostgreSQL session-level advisory locks released when the view returns, so no
+    transaction is held open for the request; a dropped connection releases its lock too.
+    The limit is only enforced on PostgreSQL; on other databases the view runs unlimited
+    """
+    slot_keys = advisory_slot_keys(scope, limit)
+    
+    def decorator(view_method):
+        @wraps(view_method)
+        def wrapper(self, request, *args, **kwargs):
+            if connection.vendor != 'postgresql':
+                return view_method(self, request, *args, **kwargs)
+            with connection.cursor() as cursor:
+                for slot_key in slot_keys:
+                    cursor.execute('SELECT pg_try_advisory_lock(%s, %s)', [slot_key, request.user.pk])
+                    if cursor.fetchone()[0]:
+                        break
+                else:
+                    return Response({
+                        'error': f'Too many uploads in progress. At most {limit} at a time.'
+                    }, status=status.HTTP_429_TOO_MANY_REQUESTS)
+            try:
+                return view_method(self, request, *args, **kwargs)
+            finally:
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT pg_advisory_unlock(%s, %s)', [slot_key, request.user.pk])
+        return wrapper
+    return decorator
+
 # Pagination classes
-class StandardResultsSetPagination(PageNumberPagination):
+class FetchedPagePaginator(Paginator):
+    """
+    Paginator for one page whose rows and total were already fetched together;
+    page() hands out those rows and the count never queries
+    """
+    def __init__(self, object_list, per_page, rows, total, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.rows = rows
+        self.total = total
+    
+    @cached_property
+    def count(self):
+        return self.total
+    
+    def page(self, number):
+        return Page(self.rows, self.validate_number(number), self)
+
+class WindowCountPagination(PageNumberPagination):
+    """
+    Page-number pagination that reads the total from COUNT(*) OVER () on the page query,
+    so a page costs one query instead of a SELECT COUNT(*) plus the page SELECT.
+    DISTINCT querysets, 'last' and out-of-range pages take the standard two-query path
+    """
+    count_annotation = 'window_total_count'
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        page_size = self.get_page_size(request)
+        page_number = request.query_params.get(self.page_query_param) or 1
+        if not page_size or queryset.query.distinct or not str(page_number).isdigit() or int(page_number) < 1:
+            return super().paginate_queryset(queryset, request, view)
+        
+        page_number = int(page_number)
+        offset = (page_number - 1) * page_size
+        rows = list(queryset.annotate(**{self.count_annotation: Window(Count('*'))})[offset:offset + page_size])
+        if not rows:
+            # Empty or past the end: let the stock path count and raise NotFound as before
+            return super().paginate_queryset(queryset, request, view)
+        
+        if isinstance(rows[0], dict):  # values() querysets
+            total = rows[0][self.count_annotation]
+            for row in rows:
+                del row[self.count_annotation]
+        else:
+            total = getattr(rows[0], self.count_annotation)
+        
+        paginator = FetchedPagePaginator(queryset, page_size, rows, total)
+        self.page = paginator.page(page_number)
+        if paginator.num_pages > 1 and self.template is not None:
+            self.display_page_controls = True
+        self.request = request
+        return rows
+
+class StandardResultsSetPagination(WindowCountPagination):
     page_size = 12
     page_size_query_param = 'page_size'
     max_page_size = 1000  # Increased to allow fetching all colleagues
 
-class LargeResultsSetPagination(PageNumberPagination):
+class LargeResultsSetPagination(WindowCountPagination):
+    page_size = 24
+    page_size_query_param = 'page_size'
+    max_page_size = 200
+
+class PhotoCursorPagination(CursorPagination):
+    """Keyset pagination on created_at - deep pages cost the same as the first one"""
     page_size = 24
     page_size_query_param = 'page_size'
     max_page_size = 200
+    ordering = '-created_at'
+
+class PhotoFeedPagination(LargeResultsSetPagination):
+    """
+    Page-number pagination by default (keeps existing clients working),
+    switches to keyset pagination when the client sends ?cursor= (empty for the first page)
+    """
+    cursor_paginator = None
+    
+    def paginate_queryset(self, queryset, request, view=None):
+        if PhotoCursorPagination.cursor_query_param in request.query_params:
+            self.cursor_paginator = PhotoCursorPagination()
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        self.cursor_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+    
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+class PublicReadPermissionsMixin:
+    """
+    Anyone may use the actions in `public_actions`; every other action requires an admin.
+    Permission classes are stateless, so the instances are built once and shared by all requests
+    """
+    public_actions = frozenset({'list', 'retrieve'})
+    public_permissions = ()
+    admin_permissions = (IsAdminUser(),)
+    
+    def get_permissions(self):
+        if self.action in self.public_actions:
+            return self.public_permissions
+        return self.admin_permissions
 
 # Create your views here.
 
@@ -78,68 +316,92 @@ def health_check(request):
         'service': 'college_backend'
     }, status=status.HTTP_200_OK)
 
+@lru_cache(maxsize=4)
+def disk_usage_for_minute(path, minute):
+    """shutil.disk_usage memoized per minute - disk totals need not follow every upload like the counts do"""
+    return shutil.disk_usage(path)
+
+def compute_dashboard_stats():
+    """Build the dashboard statistics payload (cached by dashboard_stats)"""
+    from django.conf import settings
+    
+    # Get media directory stats
+    media_path = settings.MEDIA_ROOT
+    disk_usage = disk_usage_for_minute(media_path, int(time.time()) // 60)
+    
+    # One aggregate per table: row counts, colleague status buckets (conditional COUNTs)
+    # and the stored file sizes used for the media total
+    memory_photos = MemoryPhoto.objects.aggregate(count=Count('id'), size=Sum('file_size'))
+    meeting_photos = MeetingPhoto.objects.aggregate(count=Count('id'), size=Sum('file_size'))
+    colleagues = Colleague.objects.aggregate(
+        total=Count('id'),
+        active=Count('id', filter=Q(status='active')),
+        promoted=Count('id', filter=Q(status='promoted')),
+        deceased=Count('id', filter=Q(status='deceased')),
+        size=Sum('file_size'),
+    )
+    archive_size = ColleagueArchiveImage.objects.aggregate(size=Sum('file_size'))['size']
+    memory_photos_count = memory_photos['count']
+    meeting_photos_count = meeting_photos['count']
+    
+    # Count categories
+    memory_categories_count = MemoryCategory.objects.count()
+    meeting_categories_count = MeetingCategory.objects.count()
+    
+    # Calculate percentages
+    disk_used_percent = (disk_usage.used / disk_usage.total) * 100
+    
+    # Total size of uploaded media from the stored per-row sizes (no disk walk)
+    media_size = sum(
+        size or 0 for size in (memory_photos['size'], meeting_photos['size'], colleagues['size'], archive_size)
+    )
+    
+    stats = {
+        'photos': {
+            'memory_photos': memory_photos_count,
+            'meeting_photos': meeting_photos_count,
+            'total_photos': memory_photos_count + meeting_photos_count,
+        },
+        'categories': {
+            'memory_categories': memory_categories_count,
+            'meeting_categories': meeting_categories_count,
+            'total_categories': memory_categories_count + meeting_categories_count,
+        },
+        'colleagues': {
+            'total': colleagues['total'],
+            'active': colleagues['active'],
+            'promoted': colleagues['promoted'],
+            'deceased': colleagues['deceased'],
+        },
+        'storage': {
+            'total_gb': round(disk_usage.total / (1024**3), 2),
+            'used_gb': round(disk_usage.used / (1024**3), 2),
+            'free_gb': round(disk_usage.free / (1024**3), 2),
+            'used_percent': round(disk_used_percent, 1),
+            'media_size_mb': round(media_size / (1024**2), 2),
+        },
+        'timestamp': timezone.now().isoformat(),
+    }
+    return stats
+
+
 @api_view(['GET'])
 def dashboard_stats(request):
     """
     Dashboard statistics endpoint - shows server stats and content metrics
     Requires authentication
+    Cached briefly; photo, category and colleague changes invalidate the cache (see models)
+    The ETag follows the cached payload, so polling clients get a 304 until it is rebuilt
     """
-    from django.conf import settings
-    import shutil
-    
     try:
-        # Get media directory stats
-        media_path = settings.MEDIA_ROOT
-        disk_usage = shutil.disk_usage(media_path)
-        
-        # Count photos and colleagues
-        memory_photos_count = MemoryPhoto.objects.count()
-        meeting_photos_count = MeetingPhoto.objects.count()
-        colleagues_count = Colleague.objects.count()
-        
-        # Count categories
-        memory_categories_count = MemoryCategory.objects.count()
-        meeting_categories_count = MeetingCategory.objects.count()
-        
-        # Calculate percentages
-        disk_used_percent = (disk_usage.used / disk_usage.total) * 100
-        
-        # Calculate media directory size
-        media_size = 0
-        for dirpath, dirnames, filenames in os.walk(media_path):
-            for filename in filenames:
-                filepath = os.path.join(dirpath, filename)
-                if os.path.isfile(filepath):
-                    media_size += os.path.getsize(filepath)
-        
-        stats = {
-            'photos': {
-                'memory_photos': memory_photos_count,
-                'meeting_photos': meeting_photos_count,
-                'total_photos': memory_photos_count + meeting_photos_count,
-            },
-            'categories': {
-                'memory_categories': memory_categories_count,
-                'meeting_categories': meeting_categories_count,
-                'total_categories': memory_categories_count + meeting_categories_count,
-            },
-            'colleagues': {
-                'total': colleagues_count,
-                'active': Colleague.objects.filter(status='active').count(),
-                'promoted': Colleague.objects.filter(status='promoted').count(),
-                'deceased': Colleague.objects.filter(status='deceased').count(),
-            },
-            'storage': {
-                'total_gb': round(disk_usage.total / (1024**3), 2),
-                'used_gb': round(disk_usage.used / (1024**3), 2),
-                'free_gb': round(disk_usage.free / (1024**3), 2),
-                'used_percent': round(disk_used_percent, 1),
-                'media_size_mb': round(media_size / (1024**2), 2),
-            },
-            'timestamp': timezone.now().isoformat(),
-        }
-        
-        return Response(stats, status=status.HTTP_200_OK)
+        stats = cache.get_or_set(DASHBOARD_STATS_CACHE_KEY, compute_dashboard_stats, DASHBOARD_STATS_CACHE_TIMEOUT)
+        etag = '"%s"' % hashlib.md5(stats['timestamp'].encode()).hexdigest()
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = Response(stats, status=status.HTTP_200_OK)
+            response['ETag'] = etag
+        patch_cache_control(response, private=True, no_cache=True, max_age=0)
+        return response
         
     except Exception as e:
         logger.error(f"Error fetching dashboard stats: {str(e)}")
@@ -148,14 +410,15 @@ def dashboard_stats(request):
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 @api_view(['POST'])
-@throttle_classes([LoginRateThrottle])
+@throttle_classes([LoginBlacklistThrottle, LoginRateThrottle])
 def admin_login(request):
     """
     Authenticate against Django users and allow ONLY superusers.
     Expected body: { "username": string, "password": string }
     Returns 200 with { username, token } if valid superuser; 401 otherwise.
     
-    Rate limited to 5 attempts per hour per IP to prevent brute force attacks.
+    Rate limited to 5 attempts per hour per IP to prevent brute force attacks;
+    clients that keep failing are blacklisted before their password is hashed.
     """
     username = request.data.get('username')
     password = request.data.get('password')
@@ -178,14 +441,17 @@ def admin_login(request):
 
     if user is None:
         logger.warning(f"Failed login attempt for username '{username}' from {request.META.get('REMOTE_ADDR')}")
+        record_login_failure(request)
         return Response({ 'detail': 'Invalid credentials.' }, status=status.HTTP_401_UNAUTHORIZED)
 
     if not user.is_active:
         logger.warning(f"Login attempt for inactive user '{username}' from {request.META.get('REMOTE_ADDR')}")
+        record_login_failure(request)
         return Response({ 'detail': 'User account is disabled.' }, status=status.HTTP_403_FORBIDDEN)
 
     if not user.is_superuser:
         logger.warning(f"Non-superuser '{username}' attempted admin login from {request.META.get('REMOTE_ADDR')}")
+        record_login_failure(request)
         return Response({ 'detail': 'Admin access denied. Superuser required.' }, status=status.HTTP_403_FORBIDDEN)
 
     # Issue or retrieve an API token for the authenticated admin user
@@ -245,7 +511,184 @@ def download_memory_book(request):
             'details': error_details
         }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-class MemoryCategoryViewSet(ModelViewSet):
+def stream_json_list(queryset, serializer_class, context, cache_key):
+    """
+    Yield a JSON array one serialized row at a time, reading rows (and their prefetches)
+    WITH_PHOTOS_CHUNK_SIZE at a time. Only the encoded bytes are kept, and the complete
+    body is cached once it has been sent
+    """
+    renderer = ORJSONRenderer()
+    chunks = [b'[']
+    yield b'['
+    for index, obj in enumerate(queryset.iterator(chunk_size=WITH_PHOTOS_CHUNK_SIZE)):
+        chunk = (b',' if index else b'') + renderer.render(serializer_class(obj, context=context).data)
+        chunks.append(chunk)
+        yield chunk
+    chunks.append(b']')
+    yield b']'
+    cache.set(cache_key, b''.join(chunks), WITH_PHOTOS_CACHE_TIMEOUT)
+
+def with_photos_response(request, category_model, photo_model, categories, serializer_class):
+    """
+    Conditional, cached response for the categories-with-photos actions.
+    The ETag covers the URL (payloads hold absolute media URLs) and the count and last
+    change of categories and photos (one aggregate query each), so any create, edit or
+    delete changes it. Matching clients get a 304; otherwise the encoded body comes from
+    the cache, or is streamed and cached once per version.
+    """
+    category_state = category_model.objects.order_by().aggregate(count=Count('pk'), last_modified=Max('updated_at'))
+    photo_state = photo_model.objects.order_by().aggregate(count=Count('pk'), last_modified=Max('updated_at'))
+    version = '|'.join(str(value) for value in (*category_state.values(), *photo_state.values()))
+    digest = hashlib.md5(f'{request.build_absolute_uri()}|{version}'.encode()).hexdigest()
+    etag = f'"{digest}"'
+    
+    response = get_conditional_response(request, etag=etag)
+    if response is None:
+        cache_key = f'{category_model._meta.model_name}:with_photos:{digest}'
+        body = cache.get(cache_key)
+        if body is not None:
+            response = HttpResponse(body, content_type='application/json')
+        else:
+            response = StreamingHttpResponse(
+                stream_json_list(categories, serializer_class, {'request': request}, cache_key),
+                content_type='application/json'
+            )
+        response['ETag'] = etag
+    # Clients must revalidate every time, so new and deleted photos still show immediately
+    patch_cache_control(response, no_cache=True, max_age=0)
+    return response
+
+class BulkUploadMixin:
+    """
+    bulk_upload action shared by the photo viewsets; subclasses set the photo and category
+    models, and serializer_class serializes the created photos
+    """
+    photo_model = None
+    category_model = None
+    
+    @action(detail=False, methods=['post'], permission_classes=[IsAdminUser], throttle_classes=[UploadRateThrottle])
+    @limit_concurrency('bulk_upload', BULK_UPLOAD_CONCURRENCY)
+    def bulk_upload(self, request):
+        """
+        Bulk upload multiple photos into one category, with optional names and descriptions
+        Rate limited to prevent server overload. Validates file size, type, and dimensions.
+        Images are stored as JPEGs of at most 1920px, each with a 400px thumbnail.
+        """
+        try:
+            category_id = request.data.get('category')
+            if not category_id:
+                return Response({
+                    'error': 'Category ID is required'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Verify category exists
+            try:
+                category = self.category_model.objects.get(id=category_id)
+            except self.category_model.DoesNotExist:
+                return Response({
+                    'error': 'Category not found'
+                }, status=status.HTTP_404_NOT_FOUND)
+            
+            # Get uploaded files
+            uploaded_files = request.FILES.getlist('images')
+            if not uploaded_files:
+                return Response({
+                    'error': 'No images provided'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Limit number of files per upload to prevent DoS
+            max_files = 200
+            if len(uploaded_files) > max_files:
+                return Response({
+                    'error': f'Too many files. Maximum {max_files} files per upload.'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Validate all files before processing (in parallel, first failure reported)
+            invalid = find_invalid_upload(uploaded_files)
+            if invalid:
+                idx, file, e = invalid
+                return Response({
+                    'error': f'File {idx + 1} ({file.name}): {str(e)}'
+                }, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Get metadata for each image (optional), parsed once into a list indexed by file position
+            photo_metadata = [{} for _ in uploaded_files]
+            for key, value in request.data.items():
+                match = METADATA_KEY_RE.fullmatch(key)
+                if match and int(match[1]) < len(photo_metadata):
+                    photo_metadata[int(match[1])][match[2]] = value
+            
+            photos = []
+            errors = []
+            for i, image_file in enumerate(uploaded_files):
+                photo = None
+                try:
+                    # Get metadata for this specific image
+                    metadata = photo_metadata[i]
+                    
+                    photo = self.photo_model(
+                        category=category,
+                        description_ar=metadata.get('description', ''),
+                        is_featured=metadata.get('is_featured', 'false').lower() == 'true',
+                        uploaded_by=request.user
+                    )
+                    # Store the files now, so the transaction below only spans the INSERT.
+                    # One decode yields the resized image and its thumbnail; an upload PIL
+                    # can't re-encode is kept as sent, without a thumbnail
+                    optimized, thumbnail = process_image(image_file)
+                    if optimized is None:
+                        photo.image.save(image_file.name, image_file, save=False)
+                        photo.file_size = image_file.size
+                    else:
+                        photo.image.save(optimized.name, optimized, save=False)
+                        photo.thumbnail.save(thumbnail.name, thumbnail, save=False)
+                        photo.file_size = optimized.size + thumbnail.size
+                    photos.append(photo)
+                    
+                except Exception as e:
+                    if photo is not None:
+                        # The image may be stored already when its thumbnail fails
+                        delete_files_if_exist([photo.image.name, photo.thumbnail.name])
+                    errors.append({
+                        'image_index': i,
+                        'image_name': image_file.name if hasattr(image_file, 'name') else f'Image {i}',
+                        'error': str(e)
+                    })
+            
+            # One batched INSERT in a single transaction.
+            # bulk_create skips model signals, so apply what they maintain explicitly
+            try:
+                with transaction.atomic():
+                    self.photo_model.objects.bulk_create(photos, batch_size=50)
+                    adjust_photos_count(self.category_model, category.pk, len(photos))
+                    transaction.on_commit(lambda: cache.delete(DASHBOARD_STATS_CACHE_KEY))
+            except Exception:
+                # No row points at the files stored above, so don't leave them on disk
+                delete_files_if_exist([name for photo in photos for name in (photo.image.name, photo.thumbnail.name)])
+                raise
+            
+            created_photos = self.get_serializer(photos, many=True).data
+            
+            response_data = {
+                'success': True,
+                'created_count': len(created_photos),
+                'total_count': len(uploaded_files),
+                'created_photos': created_photos
+            }
+            
+            if errors:
+                response_data['errors'] = errors
+                response_data['error_count'] = len(errors)
+            
+            return Response(response_data, status=status.HTTP_201_CREATED)
+            
+        except Exception as e:
+            return Response({
+                'error': f'Bulk upload failed: {str(e)}'
+            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+
+class MemoryCategoryViewSet(PublicReadPermissionsMixin, ModelViewSet):
     """
     ViewSet for managing memory categories (صور تذكارية)
     Optimized with Count annotation to prevent N+1 queries
@@ -253,6 +696,8 @@ class MemoryCategoryViewSet(ModelViewSet):
     queryset = MemoryCategory.objects.all()  # Base queryset for router
     serializer_class = MemoryCategorySerializer
     permission_classes = [IsAuthenticated]
+    # photos serves the list the public detail response used to nest, so it is public like retrieve
+    public_actions = PublicReadPermissionsMixin.public_actions | {'with_photos', 'photos'}
     pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     search_fields = ['name', 'description']
@@ -260,47 +705,46 @@ class MemoryCategoryViewSet(ModelViewSet):
     ordering = ['name']
     
     def get_queryset(self):
-        """Optimize queryset with annotations to prevent N+1 queries"""
-        return MemoryCategory.objects.annotate(
-            photos_count=Count('photos')
-        ).prefetch_related('photos')
+        """photos_count is a stored column, so the list needs no COUNT/JOIN"""
+        queryset = MemoryCategory.objects.all()
+        if self.action == 'list':
+            # Every list field is a plain column, so serialize row dicts instead of model instances
+            return queryset.values(*MemoryCategorySerializer.Meta.fields)
+        if self.action == 'with_photos':
+            # Only with_photos nests photos; the prefetch also fills photo.category,
+            # so category_name needs no per-photo query
+            queryset = queryset.prefetch_related(Prefetch('photos', queryset=MemoryPhoto.objects.all()))
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return MemoryCategoryDetailSerializer
         return MemoryCategorySerializer
     
-    def get_permissions(self):
-        """
-        Instantiates and returns the list of permissions that this view requires.
-        """
-        if self.action in ['list', 'retrieve', 'with_photos']:
-            permission_classes = []
-        else:
-            permission_classes = [IsAdminUser]
-        return [permission() for permission in permission_classes]
-    
     def destroy(self, request, *args, **kwargs):
         """Override destroy to log file deletion"""
         instance = self.get_object()
-        photos_count = instance.photos.count()
+        photos_count = instance.photos_count
         category_name = instance.name
         
         # Perform the deletion (signals will handle file cleanup)
         response = super().destroy(request, *args, **kwargs)
         
         # Log the deletion
-        print(f"Memory Category '{category_name}' deleted with {photos_count} photos and their files")
+        logger.info("Memory Category %r deleted with %d photos and their files", category_name, photos_count)
         
         return response
     
     @action(detail=True, methods=['get'])
     def photos(self, request, pk=None):
-        """Get all photos for a specific memory category"""
+        """Get the photos of a specific memory category, keyset-paginated (?cursor=...)"""
         category = self.get_object()
-        photos = category.photos.all()
-        serializer = MemoryPhotoSerializer(photos, many=True, context={'request': request})
-        return Response(serializer.data)
+        photos = MemoryPhotoSerializer.setup_eager_loading(MemoryPhoto.objects.filter(category_id=category.pk))
+        paginator = PhotoCursorPagination()
+        # Not view=self: the cursor would take this category viewset's ordering (name/year)
+        page = paginator.paginate_queryset(photos, request, view=None)
+        serializer = MemoryPhotoSerializer(page, many=True, context={'request': request})
+        return paginator.get_paginated_response(serializer.data)
     
     @action(detail=False, methods=['get'], permission_classes=[])
     def with_photos(self, request):
@@ -318,23 +762,20 @@ class MemoryCategoryViewSet(ModelViewSet):
             except (ValueError, TypeError):
                 pass  # Ignore invalid limit values
         
-        serializer = MemoryCategoryDetailSerializer(categories, many=True, context={'request': request})
-        
-        # Add cache control headers for better performance
-        response = Response(serializer.data)
-        response['Cache-Control'] = 'no-store, max-age=0'
-        return response
+        return with_photos_response(request, MemoryCategory, MemoryPhoto, categories, MemoryCategoryWithPhotosSerializer)
 
 
-class MemoryPhotoViewSet(ModelViewSet):
+class MemoryPhotoViewSet(BulkUploadMixin, PublicReadPermissionsMixin, ModelViewSet):
     """
     ViewSet for managing memory photos
     Optimized with select_related to prevent N+1 queries on category
     """
     queryset = MemoryPhoto.objects.all()  # Base queryset for router
     serializer_class = MemoryPhotoSerializer
+    photo_model = MemoryPhoto
+    category_model = MemoryCategory
     permission_classes = [IsAuthenticated]
-    pagination_class = LargeResultsSetPagination
+    pagination_class = PhotoFeedPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['category', 'is_featured']
     search_fields = ['description_ar']
@@ -343,17 +784,7 @@ class MemoryPhotoViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Optimize queryset with select_related for category"""
-        return MemoryPhoto.objects.select_related('category', 'uploaded_by')
-    
-    def get_permissions(self):
-        """
-        Instantiates and returns the list of permissions that this view requires.
-        """
-        if self.action in ['list', 'retrieve']:
-            permission_classes = []
-        else:
-            permission_classes = [IsAdminUser]
-        return [permission() for permission in permission_classes]
+        return MemoryPhotoSerializer.setup_eager_loading(MemoryPhoto.objects.all())
     
     def create(self, request, *args, **kwargs):
         """Override create to add detailed error logging"""
@@ -370,109 +801,9 @@ class MemoryPhotoViewSet(ModelViewSet):
     
     def perform_create(self, serializer):
         serializer.save(uploaded_by=self.request.user)
-    
-    @action(detail=False, methods=['post'], permission_classes=[IsAdminUser], throttle_classes=[UploadRateThrottle])
-    def bulk_upload(self, request):
-        """
-        Bulk upload multiple memory photos with optional names and descriptions
-        Rate limited to prevent server overload. Validates file size, type, and dimensions.
-        """
-        try:
-            category_id = request.data.get('category')
-            if not category_id:
-                return Response({
-                    'error': 'Category ID is required'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Verify category exists
-            try:
-                category = MemoryCategory.objects.get(id=category_id)
-            except MemoryCategory.DoesNotExist:
-                return Response({
-                    'error': 'Category not found'
-                }, status=status.HTTP_404_NOT_FOUND)
-            
-            # Get uploaded files
-            uploaded_files = request.FILES.getlist('images')
-            if not uploaded_files:
-                return Response({
-                    'error': 'No images provided'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Limit number of files per upload to prevent DoS
-            max_files = 200
-            if len(uploaded_files) > max_files:
-                return Response({
-                    'error': f'Too many files. Maximum {max_files} files per upload.'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Validate all files before processing
-            for idx, file in enumerate(uploaded_files):
-                try:
-                    validate_uploaded_image(file)
-                except Exception as e:
-                    return Response({
-                        'error': f'File {idx + 1} ({file.name}): {str(e)}'
-                    }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Get metadata for each image (optional)
-            photo_metadata = {}
-            for key, value in request.data.items():
-                if key.startswith('metadata_'):
-                    # Extract the index from the key (e.g., metadata_0_title)
-                    parts = key.split('_')
-                    if len(parts) >= 3:
-                        index = parts[1]
-                        field = '_'.join(parts[2:])
-                        if index not in photo_metadata:
-                            photo_metadata[index] = {}
-                        photo_metadata[index][field] = value
-            
-            created_photos = []
-            errors = []
-            
-            for i, image_file in enumerate(uploaded_files):
-                try:
-                    # Get metadata for this specific image
-                    metadata = photo_metadata.get(str(i), {})
-                    
-                    # Create memory photo instance directly
-                    photo = MemoryPhoto.objects.create(
-                        category=category,
-                        description_ar=metadata.get('description', ''),
-                        is_featured=metadata.get('is_featured', 'false').lower() == 'true',
-                        image=image_file,
-                        uploaded_by=request.user
-                    )
-                    created_photos.append(MemoryPhotoSerializer(photo, context={'request': request}).data)
-                        
-                except Exception as e:
-                    errors.append({
-                        'image_index': i,
-                        'image_name': image_file.name if hasattr(image_file, 'name') else f'Image {i}',
-                        'error': str(e)
-                    })
-            
-            response_data = {
-                'success': True,
-                'created_count': len(created_photos),
-                'total_count': len(uploaded_files),
-                'created_photos': created_photos
-            }
-            
-            if errors:
-                response_data['errors'] = errors
-                response_data['error_count'] = len(errors)
-            
-            return Response(response_data, status=status.HTTP_201_CREATED)
-            
-        except Exception as e:
-            return Response({
-                'error': f'Bulk upload failed: {str(e)}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class MeetingCategoryViewSet(ModelViewSet):
+class MeetingCategoryViewSet(PublicReadPermissionsMixin, ModelViewSet):
     """
     ViewSet for managing meeting categories (اللقاءات)
     Optimized with Count annotation to prevent N+1 queries
@@ -480,6 +811,8 @@ class MeetingCategoryViewSet(ModelViewSet):
     queryset = MeetingCategory.objects.all()  # Base queryset for router
     serializer_class = MeetingCategorySerializer
     permission_classes = [IsAuthenticated]
+    # photos serves the list the public detail response used to nest, so it is public like retrieve
+    public_actions = PublicReadPermissionsMixin.public_actions | {'with_photos', 'photos'}
     pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     search_fields = ['name', 'description']
@@ -487,47 +820,46 @@ class MeetingCategoryViewSet(ModelViewSet):
     ordering = ['-year', 'name']  # Sort by year descending (newest first), then by name
     
     def get_queryset(self):
-        """Optimize queryset with annotations to prevent N+1 queries"""
-        return MeetingCategory.objects.annotate(
-            photos_count=Count('photos')
-        ).prefetch_related('photos')
+        """photos_count is a stored column, so the list needs no COUNT/JOIN"""
+        queryset = MeetingCategory.objects.all()
+        if self.action == 'list':
+            # Every list field is a plain column, so serialize row dicts instead of model instances
+            return queryset.values(*MeetingCategorySerializer.Meta.fields)
+        if self.action == 'with_photos':
+            # Only with_photos nests photos; the prefetch also fills photo.category,
+            # so category_name needs no per-photo query
+            queryset = queryset.prefetch_related(Prefetch('photos', queryset=MeetingPhoto.objects.all()))
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'retrieve':
             return MeetingCategoryDetailSerializer
         return MeetingCategorySerializer
     
-    def get_permissions(self):
-        """
-        Instantiates and returns the list of permissions that this view requires.
-        """
-        if self.action in ['list', 'retrieve', 'with_photos']:
-            permission_classes = []
-        else:
-            permission_classes = [IsAdminUser]
-        return [permission() for permission in permission_classes]
-    
     def destroy(self, request, *args, **kwargs):
         """Override destroy to log file deletion"""
         instance = self.get_object()
-        photos_count = instance.photos.count()
+        photos_count = instance.photos_count
         category_name = instance.name
         
         # Perform the deletion (signals will handle file cleanup)
         response = super().destroy(request, *args, **kwargs)
         
         # Log the deletion
-        print(f"Meeting Category '{category_name}' deleted with {photos_count} photos and their files")
+        logger.info("Meeting Category %r deleted with %d photos and their files", category_name, photos_count)
         
         return response
     
     @action(detail=True, methods=['get'])
     def photos(self, request, pk=None):
-        """Get all photos for a specific meeting category"""
+        """Get the photos of a specific meeting category, keyset-paginated (?cursor=...)"""
         category = self.get_object()
-        photos = category.photos.all()
-        serializer = MeetingPhotoSerializer(photos, many=True, context={'request': request})
-        return Response(serializer.data)
+        photos = MeetingPhotoSerializer.setup_eager_loading(MeetingPhoto.objects.filter(category_id=category.pk))
+        paginator = PhotoCursorPagination()
+        # Not view=self: the cursor would take this category viewset's ordering (name/year)
+        page = paginator.paginate_queryset(photos, request, view=None)
+        serializer = MeetingPhotoSerializer(page, many=True, context={'request': request})
+        return paginator.get_paginated_response(serializer.data)
     
     @action(detail=False, methods=['get'], permission_classes=[])
     def with_photos(self, request):
@@ -545,23 +877,20 @@ class MeetingCategoryViewSet(ModelViewSet):
             except (ValueError, TypeError):
                 pass  # Ignore invalid limit values
         
-        serializer = MeetingCategoryDetailSerializer(categories, many=True, context={'request': request})
-        
-        # Add cache control headers for better performance
-        response = Response(serializer.data)
-        response['Cache-Control'] = 'no-store, max-age=0'
-        return response
+        return with_photos_response(request, MeetingCategory, MeetingPhoto, categories, MeetingCategoryWithPhotosSerializer)
 
 
-class MeetingPhotoViewSet(ModelViewSet):
+class MeetingPhotoViewSet(BulkUploadMixin, PublicReadPermissionsMixin, ModelViewSet):
     """
     ViewSet for managing meeting photos
     Optimized with select_related to prevent N+1 queries on category
     """
     queryset = MeetingPhoto.objects.all()  # Base queryset for router
     serializer_class = MeetingPhotoSerializer
+    photo_model = MeetingPhoto
+    category_model = MeetingCategory
     permission_classes = [IsAuthenticated]
-    pagination_class = LargeResultsSetPagination
+    pagination_class = PhotoFeedPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['category', 'is_featured']
     search_fields = ['description_ar']
@@ -570,17 +899,7 @@ class MeetingPhotoViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Optimize queryset with select_related for category"""
-        return MeetingPhoto.objects.select_related('category', 'uploaded_by')
-    
-    def get_permissions(self):
-        """
-        Instantiates and returns the list of permissions that this view requires.
-        """
-        if self.action in ['list', 'retrieve']:
-            permission_classes = []
-        else:
-            permission_classes = [IsAdminUser]
-        return [permission() for permission in permission_classes]
+        return MeetingPhotoSerializer.setup_eager_loading(MeetingPhoto.objects.all())
     
     def create(self, request, *args, **kwargs):
         """Override create to add detailed error logging"""
@@ -598,109 +917,9 @@ class MeetingPhotoViewSet(ModelViewSet):
     def perform_create(self, serializer):
         """Create meeting photo"""
         serializer.save(uploaded_by=self.request.user)
-    
-    @action(detail=False, methods=['post'], permission_classes=[IsAdminUser], throttle_classes=[UploadRateThrottle])
-    def bulk_upload(self, request):
-        """
-        Bulk upload multiple meeting photos with optional names and descriptions
-        Rate limited to prevent server overload. Validates file size, type, and dimensions.
-        """
-        try:
-            category_id = request.data.get('category')
-            if not category_id:
-                return Response({
-                    'error': 'Category ID is required'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Verify category exists
-            try:
-                category = MeetingCategory.objects.get(id=category_id)
-            except MeetingCategory.DoesNotExist:
-                return Response({
-                    'error': 'Category not found'
-                }, status=status.HTTP_404_NOT_FOUND)
-            
-            # Get uploaded files
-            uploaded_files = request.FILES.getlist('images')
-            if not uploaded_files:
-                return Response({
-                    'error': 'No images provided'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Limit number of files per upload to prevent DoS
-            max_files = 200
-            if len(uploaded_files) > max_files:
-                return Response({
-                    'error': f'Too many files. Maximum {max_files} files per upload.'
-                }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Validate all files before processing
-            for idx, file in enumerate(uploaded_files):
-                try:
-                    validate_uploaded_image(file)
-                except Exception as e:
-                    return Response({
-                        'error': f'File {idx + 1} ({file.name}): {str(e)}'
-                    }, status=status.HTTP_400_BAD_REQUEST)
-            
-            # Get metadata for each image (optional)
-            photo_metadata = {}
-            for key, value in request.data.items():
-                if key.startswith('metadata_'):
-                    # Extract the index from the key (e.g., metadata_0_title)
-                    parts = key.split('_')
-                    if len(parts) >= 3:
-                        index = parts[1]
-                        field = '_'.join(parts[2:])
-                        if index not in photo_metadata:
-                            photo_metadata[index] = {}
-                        photo_metadata[index][field] = value
-            
-            created_photos = []
-            errors = []
-            
-            for i, image_file in enumerate(uploaded_files):
-                try:
-                    # Get metadata for this specific image
-                    metadata = photo_metadata.get(str(i), {})
-                    
-                    # Create meeting photo instance directly
-                    photo = MeetingPhoto.objects.create(
-                        category=category,
-                        description_ar=metadata.get('description', ''),
-                        is_featured=metadata.get('is_featured', 'false').lower() == 'true',
-                        image=image_file,
-                        uploaded_by=request.user
-                    )
-                    created_photos.append(MeetingPhotoSerializer(photo, context={'request': request}).data)
-                        
-                except Exception as e:
-                    errors.append({
-                        'image_index': i,
-                        'image_name': image_file.name if hasattr(image_file, 'name') else f'Image {i}',
-                        'error': str(e)
-                    })
-            
-            response_data = {
-                'success': True,
-                'created_count': len(created_photos),
-                'total_count': len(uploaded_files),
-                'created_photos': created_photos
-            }
-            
-            if errors:
-                response_data['errors'] = errors
-                response_data['error_count'] = len(errors)
-            
-            return Response(response_data, status=status.HTTP_201_CREATED)
-            
-        except Exception as e:
-            return Response({
-                'error': f'Bulk upload failed: {str(e)}'
-            }, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
-class MeetingVideoViewSet(ModelViewSet):
+class MeetingVideoViewSet(PublicReadPermissionsMixin, ModelViewSet):
     """
     ViewSet for managing meeting YouTube videos
     """
@@ -716,30 +935,21 @@ class MeetingVideoViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Optimize queryset with select_related for category"""
-        return MeetingVideo.objects.select_related('category', 'added_by')
-    
-    def get_permissions(self):
-        """
-        Instantiates and returns the list of permissions that this view requires.
-        """
-        if self.action in ['list', 'retrieve']:
-            permission_classes = []
-        else:
-            permission_classes = [IsAdminUser]
-        return [permission() for permission in permission_classes]
+        return MeetingVideoSerializer.setup_eager_loading(MeetingVideo.objects.all())
     
     def perform_create(self, serializer):
         """Create meeting video"""
         serializer.save(added_by=self.request.user)
 
 
-class ColleagueViewSet(ModelViewSet):
+class ColleagueViewSet(PublicReadPermissionsMixin, ModelViewSet):
     """
     ViewSet for managing colleagues (الزملاء)
     """
     queryset = Colleague.objects.all()
     serializer_class = ColleagueSerializer
     permission_classes = [IsAuthenticated]
+    public_actions = PublicReadPermissionsMixin.public_actions | {'by_status', 'promoted', 'deceased'}
     pagination_class = StandardResultsSetPagination
     filter_backends = [DjangoFilterBackend, SearchFilter, OrderingFilter]
     filterset_fields = ['status', 'is_featured']
@@ -749,23 +959,23 @@ class ColleagueViewSet(ModelViewSet):
     
     def get_queryset(self):
         """Optimize queryset with prefetch_related for archive photos"""
-        return Colleague.objects.prefetch_related('archive_photos')
+        return ColleagueSerializer.setup_eager_loading(Colleague.objects.all())
     
-    def get_permissions(self):
+    def list(self, request, *args, **kwargs):
         """
-        Instantiates and returns the list of permissions that this view requires.
+        List with an ETag so unchanged pages are answered with 304 instead of re-serialized.
+        The tag comes from a version kept in the cache, which colleague and archive photo
+        writes drop (see api.models), so computing it costs no query.
         """
-        if self.action in ['list', 'retrieve', 'by_status', 'promoted', 'deceased']:
-            permission_classes = []
-        else:
-            permission_classes = [IsAdminUser]
-        return [permission() for permission in permission_classes]
-    
-    def list(self, request, *args, **kwargs):
-        """Override list to add cache control headers"""
-        response = super().list(request, *args, **kwargs)
-        # Disable caching to ensure immediate updates after deletion
-        response['Cache-Control'] = 'no-store, max-age=0'
+        version = cache.get_or_set(COLLEAGUES_VERSION_CACHE_KEY, lambda: os.urandom(8).hex(), COLLEAGUES_VERSION_CACHE_TIMEOUT)
+        etag = '"%s"' % hashlib.md5(f'{request.get_full_path()}|{version}'.encode()).hexdigest()
+        
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+            response['ETag'] = etag
+        # Clients must revalidate every time, so updates after deletion still show immediately
+        patch_cache_control(response, no_cache=True, max_age=0)
         return response
     
     def create(self, request, *args, **kwargs):
@@ -931,32 +1141,41 @@ class ColleagueViewSet(ModelViewSet):
         logger.info(f"Colleague '{colleague_name}' deleted with {archive_count} archive photos")
         return response
     
+    def paginated_colleagues(self, queryset):
+        """
+        Serialize one page of colleagues, honouring the list filters, search and ordering.
+        archive_photos come from get_queryset's prefetch, so a page costs a fixed number of queries.
+        by_status/promoted/deceased keep their original bare-list response unless the client asks
+        for a page with ?page= or ?page_size=; only then is an invalid ?status= a 400
+        """
+        if not any(param in self.request.query_params for param in (
+            self.paginator.page_query_param, self.paginator.page_size_query_param
+        )):
+            try:
+                queryset = self.filter_queryset(queryset)
+            except DRFValidationError:
+                queryset = queryset.none()  # As before, an unknown ?status= matches nobody
+            serializer = ColleagueSerializer(queryset, many=True, context=self.get_serializer_context())
+            return Response(serializer.data)
+        
+        page = self.paginate_queryset(self.filter_queryset(queryset))
+        serializer = ColleagueSerializer(page, many=True, context=self.get_serializer_context())
+        return self.get_paginated_response(serializer.data)
+    
     @action(detail=False, methods=['get'], permission_classes=[])
     def by_status(self, request):
-        """Get colleagues grouped by status"""
-        status_param = request.query_params.get('status')
-        
-        if status_param:
-            colleagues = self.get_queryset().filter(status=status_param)
-        else:
-            colleagues = self.get_queryset()
-        
-        serializer = ColleagueSerializer(colleagues, many=True, context={'request': request})
-        return Response(serializer.data)
+        """Get colleagues grouped by status (?status= is applied by the filter backend)"""
+        return self.paginated_colleagues(self.get_queryset())
     
     @action(detail=False, methods=['get'], permission_classes=[])
     def promoted(self, request):
         """Get promoted colleagues"""
-        colleagues = self.get_queryset().filter(status='promoted')
-        serializer = ColleagueSerializer(colleagues, many=True, context={'request': request})
-        return Response(serializer.data)
+        return self.paginated_colleagues(self.get_queryset().filter(status='promoted'))
     
     @action(detail=False, methods=['get'], permission_classes=[])
     def deceased(self, request):
         """Get deceased colleagues"""
-        colleagues = self.get_queryset().filter(status='deceased')
-        serializer = ColleagueSerializer(colleagues, many=True, context={'request': request})
-        return Response(serializer.data)
+        return self.paginated_colleagues(self.get_queryset().filter(status='deceased'))
     
     @action(detail=True, methods=['post'], permission_classes=[IsAdminUser], throttle_classes=[UploadRateThrottle])
     def upload_photo_1973(self, request, pk=None):
@@ -24,6 +24,7 @@ MAX_IMAGE_WIDTH = 800  # Max width in pixels for embedded images
 MAX_IMAGE_HEIGHT = 600  # Max height in pixels
 JPEG_QUALITY = 75  # JPEG quality for compression
 BATCH_SIZE = 10  # Process images in batches for memory management
+QUERY_CHUNK_SIZE = 100  # Rows (with their prefetched photos) held in memory at a time
 
 
 def optimize_image_for_word(image_path, max_width=MAX_IMAGE_WIDTH, max_height=MAX_IMAGE_HEIGHT):
@@ -301,7 +302,7 @@ def generate_memory_book_word():
     add_section_title(doc, "اللقاءات")
     
     # Get all meeting categories ordered by year descending (latest first)
-    meeting_categories = MeetingCategory.objects.prefetch_related('photos').all().order_by('-year', '-created_at')
+    meeting_categories = MeetingCategory.objects.prefetch_related('photos').order_by('-year', '-created_at').iterator(chunk_size=QUERY_CHUNK_SIZE)
     
     for meeting_category in meeting_categories:
         photos = meeting_category.photos.all()
@@ -379,7 +380,7 @@ def generate_memory_book_word():
     add_section_title(doc, "الزملاء")
     
     # Get all colleagues with photos
-    colleagues = Colleague.objects.prefetch_related('archive_photos').all().order_by('name')
+    colleagues = Colleague.objects.prefetch_related('archive_photos').order_by('name').iterator(chunk_size=QUERY_CHUNK_SIZE)
     
     for colleague in colleagues:
         # Check if colleague has any photos
@@ -475,7 +476,7 @@ def generate_memory_book_word():
     add_section_title(doc, "الذكريات")
     
     # Get all memory categories ordered by year descending (latest first)
-    memory_categories = MemoryCategory.objects.prefetch_related('photos').all().order_by('-year', 'name')
+    memory_categories = MemoryCategory.objects.prefetch_related('photos').order_by('-year', 'name').iterator(chunk_size=QUERY_CHUNK_SIZE)
     
     for memory_category in memory_categories:
         photos = memory_category.photos.all()
@@ -87,6 +87,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',  # Registers OpClass for the trigram index expressions
     'rest_framework',
     'rest_framework.authtoken',
     'django_filters',
@@ -108,6 +109,13 @@ MIDDLEWARE = [
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
 
+# Compress responses in Django only when no reverse proxy does it (nginx.conf already gzips
+# application/json); compressing twice would just move that CPU work into the gunicorn workers
+if config('GZIP_RESPONSES', default=False, cast=bool):
+    # After WhiteNoise (which serves its own pre-compressed static files), before CommonMiddleware
+    MIDDLEWARE.insert(MIDDLEWARE.index('whitenoise.middleware.WhiteNoiseMiddleware') + 1,
+                      'django.middleware.gzip.GZipMiddleware')
+
 ROOT_URLCONF = 'college_backend.urls'
 
 TEMPLATES = [
@@ -147,11 +155,19 @@ WSGI_APPLICATION = 'college_backend.wsgi.application'
 # Database configuration - supports multiple formats
 DATABASE_URL = config('DATABASE_URL', default=None)
 
+# Keep connections open between requests instead of reconnecting (TCP + auth) every time.
+# Health checks drop connections that went stale while idle. Set to 0 when using PgBouncer.
+DB_CONN_MAX_AGE = config('DB_CONN_MAX_AGE', default=60, cast=int)
+
 if DATABASE_URL:
     # Support for DATABASE_URL format (Supabase, Heroku, Railway, etc.)
     import dj_database_url
     DATABASES = {
-        'default': dj_database_url.parse(DATABASE_URL)
+        'default': dj_database_url.parse(
+            DATABASE_URL,
+            conn_max_age=DB_CONN_MAX_AGE,
+            conn_health_checks=True,
+        )
     }
 else:
     # Fallback to individual settings
@@ -163,6 +179,26 @@ else:
             'PASSWORD': config('DB_PASSWORD', default='admin'),
             'HOST': config('DB_HOST', default='localhost'),
             'PORT': config('DB_PORT', default='5432'),
+            'CONN_MAX_AGE': DB_CONN_MAX_AGE,
+            'CONN_HEALTH_CHECKS': True,
+        }
+    }
+
+# QuerySet.iterator() uses server-side cursors, which PgBouncer in transaction mode can't hold
+DATABASES['default']['DISABLE_SERVER_SIDE_CURSORS'] = config('DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool)
+
+
+# Cache
+# Without REDIS_URL every gunicorn worker keeps its own in-memory cache, so an invalidation
+# only reaches the worker that handled the write and the others serve cached values until
+# they expire. REDIS_URL shares one cache between workers (requires the redis package).
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
         }
     }
 
@@ -211,8 +247,10 @@ MEDIA_ROOT = BASE_DIR / 'media'
 
 # File upload settings - Allow bulk uploads
 DATA_UPLOAD_MAX_NUMBER_FILES = 100  # Allow up to 100 files in a single request
-DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10 MB - files larger than this go to disk
-FILE_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10 MB - max size before writing to temp file
+DATA_UPLOAD_MAX_MEMORY_SIZE = 10485760  # 10 MB - max request body size, excluding file uploads
+# Uploads above this are streamed to a temp file instead of held in worker memory;
+# with up to 100 files per request a high limit lets one bulk upload pin ~1 GB of RAM
+FILE_UPLOAD_MAX_MEMORY_SIZE = 1048576  # 1 MB
 
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
@@ -222,7 +260,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 # REST Framework Configuration
 REST_FRAMEWORK = {
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'api.renderers.ORJSONRenderer',  # Same JSON as JSONRenderer, encoded by orjson
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -230,7 +268,7 @@ REST_FRAMEWORK = {
         'rest_framework.parsers.FormParser',
     ],
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        'api.authentication.CachedTokenAuthentication',  # TokenAuthentication with the lookup cached
         'rest_framework.authentication.SessionAuthentication',
     ],
     'DEFAULT_THROTTLE_CLASSES': [
@@ -247,6 +285,11 @@ REST_FRAMEWORK = {
     'COERCE_DECIMAL_TO_STRING': True,
 }
 
+# Seconds an authenticated token's user stays cached (0 = look it up on every request).
+# Enable only with a shared cache (REDIS_URL): a per-process cache keeps a revoked token or
+# deactivated user authenticated in the other workers for this long.
+AUTH_TOKEN_CACHE_TIMEOUT = config('AUTH_TOKEN_CACHE_TIMEOUT', default=0, cast=int)
+
 # CORS Configuration for Frontend Integration
 # Separate development and production origins for better security
 
@@ -131,6 +131,9 @@ def generate_memory_book_pdf(request):
 
 
 router = DefaultRouter()
+# Mounted under api/ after api.urls, whose router already serves the API root view
+router.include_root_view = False
+router.include_format_suffixes = False
 router.register(r'memories', MemoryViewSet, basename='memory')
 
 